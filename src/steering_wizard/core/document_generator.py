@@ -4,7 +4,7 @@ import os
 import signal
 import sys
 from pathlib import Path
-from typing import List, Optional
+from typing import Iterator, List, Optional
 from datetime import datetime
 
 from rich.console import Console
@@ -27,10 +27,13 @@ class FileOverwriteError(DocumentGeneratorError):
 class DocumentGenerator:
     """Creates steering documents from collected configuration data."""
 
+    # Standard steering files this generator writes
+    STEERING_FILES = ("development-guidelines.md", "llm-guidance.md")
+
     def __init__(self, console: Optional[Console] = None):
         """Initialize the document generator."""
         self.console = console or Console()
-        self._cleanup_files: list[Path] = []
+        self._cleanup_files: set[Path] = set()
         self._setup_signal_handlers()
 
     def _setup_signal_handlers(self) -> None:
@@ -63,8 +66,8 @@ class DocumentGenerator:
             if not self._confirm_overwrite(output_path):
                 raise FileOverwriteError(f"User denied overwrite of {output_path}")
 
-        # Add to cleanup list
-        self._cleanup_files.append(output_path)
+        # Add to cleanup set
+        self._cleanup_files.add(output_path)
 
         try:
             content = self._generate_development_guidelines_content(config)
@@ -73,9 +76,8 @@ class DocumentGenerator:
         except Exception as e:
             raise DocumentGeneratorError(f"Failed to generate development guidelines: {e}") from e
         finally:
-            # Remove from cleanup list on successful completion
-            if output_path in self._cleanup_files:
-                self._cleanup_files.remove(output_path)
+            # Remove from cleanup set on successful completion
+            self._cleanup_files.discard(output_path)
 
     def generate_llm_guidance(
         self, config: ProjectConfiguration, output_path: Path
@@ -98,8 +100,8 @@ class DocumentGenerator:
             if not self._confirm_overwrite(output_path):
                 raise FileOverwriteError(f"User denied overwrite of {output_path}")
 
-        # Add to cleanup list
-        self._cleanup_files.append(output_path)
+        # Add to cleanup set
+        self._cleanup_files.add(output_path)
 
         try:
             content = self._generate_llm_guidance_content(config)
@@ -108,9 +110,40 @@ class DocumentGenerator:
         except Exception as e:
             raise DocumentGeneratorError(f"Failed to generate LLM guidance: {e}") from e
         finally:
-            # Remove from cleanup list on successful completion
-            if output_path in self._cleanup_files:
-                self._cleanup_files.remove(output_path)
+            # Remove from cleanup set on successful completion
+            self._cleanup_files.discard(output_path)
+
+    def iter_existing_files(self, output_dir: Path) -> Iterator[Path]:
+        """
+        Lazily yield existing steering files that might be overwritten.
+
+        The directory is read once; files are yielded in directory order.
+        If the directory cannot be listed, each steering file is checked
+        by name instead.
+
+        Args:
+            output_dir: Directory to check for existing files.
+
+        Yields:
+            Paths of existing steering files.
+
+        Requirements: 3.4, 4.5
+        """
+        try:
+            with os.scandir(output_dir) as entries:
+                for entry in entries:
+                    if entry.name in self.STEERING_FILES and entry.is_file():
+                        yield output_dir / entry.name
+        except (FileNotFoundError, NotADirectoryError):
+            # Nothing can be overwritten in a directory that doesn't exist yet
+            return
+        except PermissionError:
+            # Listing needs read permission on the directory, but checking
+            # the known file names only needs search permission
+            for filename in self.STEERING_FILES:
+                file_path = output_dir / filename
+                if file_path.is_file():
+                    yield file_path
 
     def check_existing_files(self, output_dir: Path) -> list[Path]:
         """
@@ -120,19 +153,14 @@ class DocumentGenerator:
             output_dir: Directory to check for existing files.
 
         Returns:
-            List of existing steering files.
+            List of existing steering files, in STEERING_FILES order.
 
         Requirements: 3.4, 4.5
         """
-        existing_files = []
-        standard_files = ["development-guidelines.md", "llm-guidance.md"]
-
-        for filename in standard_files:
-            file_path = output_dir / filename
-            if file_path.exists():
-                existing_files.append(file_path)
-
-        return existing_files
+        return sorted(
+            self.iter_existing_files(output_dir),
+            key=lambda path: self.STEERING_FILES.index(path.name),
+        )
 
     def _confirm_overwrite(self, file_path: Path) -> bool:
         """
@@ -204,7 +232,7 @@ class DocumentGenerator:
 
         Requirements: 3.1, 3.2, 3.3, 3.5
         """
-        content = f"""# Development Guidelines
+        parts = [f"""# Development Guidelines
 
 Generated on: {config.creation_date}
 
@@ -216,30 +244,30 @@ Generated on: {config.creation_date}
 - **Pytest Support**: {'Yes' if config.testing.use_pytest else 'No'}
 
 ### GitHub Configuration
-"""
+"""]
 
         if config.github.repository_url:
-            content += f"""- **Repository URL**: {config.github.repository_url}
+            parts.append(f"""- **Repository URL**: {config.github.repository_url}
 - **GitHub Actions**: {'Yes' if config.github.use_github_actions else 'No'}
-"""
+""")
         else:
-            content += "- **Repository**: Not configured\n"
+            parts.append("- **Repository**: Not configured\n")
 
-        content += f"""
+        parts.append(f"""
 ### Code Formatting
 - **Black Formatter**: {'Yes' if config.formatting.use_black else 'No'}
 - **Google Style Guide**: {'Yes' if config.formatting.use_google_style else 'No'}
-"""
+""")
 
         if config.formatting.custom_rules:
-            content += f"""
+            parts.append(f"""
 #### Custom Formatting Rules
 ```
 {config.formatting.custom_rules}
 ```
-"""
+""")
 
-        content += f"""
+        parts.append(f"""
 ### Virtualization
 - **Preference**: {config.virtualization.preference}
 - **Include venv Documentation**: {'Yes' if config.virtualization.include_venv_docs else 'No'}
@@ -249,74 +277,74 @@ Generated on: {config.creation_date}
 This document captures the development preferences for this project. These settings should be used to configure development tools and CI/CD pipelines.
 
 ### Testing Setup
-"""
+""")
 
         if config.testing.use_docker:
-            content += """
+            parts.append("""
 #### Docker Testing
 - Use Docker containers for consistent testing environments
 - Ensure Dockerfile is properly configured for the project
-"""
+""")
 
         if config.testing.use_pytest:
-            content += """
+            parts.append("""
 #### Pytest Configuration
 - Use pytest as the primary testing framework
 - Configure pytest.ini or pyproject.toml for test discovery
 - Include appropriate test coverage reporting
-"""
+""")
 
         if config.github.use_github_actions:
-            content += f"""
+            parts.append(f"""
 ### GitHub Actions
 - Configure automated testing workflows
 - Repository: {config.github.repository_url or 'TBD'}
 - Include testing across multiple Python versions if applicable
-"""
+""")
 
-        content += """
+        parts.append("""
 ### Code Quality
-"""
+""")
 
         if config.formatting.use_black:
-            content += """
+            parts.append("""
 #### Black Formatter
 - Use Black for automatic code formatting
 - Configure line length and other Black settings as needed
-"""
+""")
 
         if config.formatting.use_google_style:
-            content += """
+            parts.append("""
 #### Google Python Style Guide
 - Follow Google Python style guide for code structure
 - Use appropriate docstring formats
 - Maintain consistent naming conventions
-"""
+""")
 
         if config.virtualization.preference == "poetry":
-            content += """
+            parts.append("""
 ### Dependency Management
 - Use Poetry for dependency management and packaging
 - Maintain pyproject.toml for project configuration
 - Use Poetry environments for development
-"""
+""")
         elif config.virtualization.preference == "venv":
-            content += """
+            parts.append("""
 ### Virtual Environments
 - Use Python venv for virtual environment management
 - Maintain requirements.txt for dependencies
 - Document environment setup procedures
-"""
+""")
         elif config.virtualization.preference == "poetry_with_venv_docs":
-            content += """
+            parts.append("""
 ### Dependency Management
 - Use Poetry for dependency management and packaging
 - Maintain pyproject.toml for project configuration
 - Include venv documentation for alternative setup methods
-"""
+""")
 
         if config.virtualization.include_venv_docs:
-            content += """
+            parts.append("""
 #### Virtual Environment Setup (Alternative)
 ```bash
 # Create virtual environment
@@ -331,15 +359,15 @@ venv\\Scripts\\activate
 # Install dependencies
 pip install -r requirements.txt
 ```
-"""
+""")
 
-        content += """
+        parts.append("""
 ---
 
 *This document was generated by the Steering Docs Wizard. Update these guidelines as your project evolves.*
-"""
+""")
 
-        return content
+        return "".join(parts)
 
     def _generate_llm_guidance_content(self, config: ProjectConfiguration) -> str:
         """
@@ -353,7 +381,7 @@ pip install -r requirements.txt
 
         Requirements: 4.1, 4.2, 4.3, 4.4
         """
-        content = f"""# LLM Development Guidance
+        parts = [f"""# LLM Development Guidance
 
 **Generated on**: {config.creation_date}
 
@@ -367,89 +395,89 @@ This document provides guidance for AI development assistants working on this pr
 - **Code Formatting**: {'Black' if config.formatting.use_black else 'Manual'} + {'Google Style' if config.formatting.use_google_style else 'Custom Style'}
 
 ### Repository Information
-"""
+"""]
 
         if config.github.repository_url:
-            content += f"""- **GitHub Repository**: {config.github.repository_url}
+            parts.append(f"""- **GitHub Repository**: {config.github.repository_url}
 - **CI/CD**: {'GitHub Actions configured' if config.github.use_github_actions else 'Manual testing'}
-"""
+""")
         else:
-            content += "- **Repository**: Local development (no remote repository configured)\n"
+            parts.append("- **Repository**: Local development (no remote repository configured)\n")
 
-        content += """
+        parts.append("""
 ## Development Guidelines
 
 ### Code Quality Standards
-"""
+""")
 
         if config.formatting.use_black:
-            content += """
+            parts.append("""
 #### Formatting
 - Use Black formatter for all Python code
 - Maintain consistent code formatting across the project
-"""
+""")
 
         if config.formatting.use_google_style:
-            content += """
+            parts.append("""
 #### Style Guide
 - Follow Google Python Style Guide
 - Use proper docstring formats
 - Maintain clear and descriptive variable names
-"""
+""")
 
         if config.formatting.custom_rules:
-            content += f"""
+            parts.append(f"""
 #### Custom Formatting Rules
 The project has specific formatting requirements:
 
 ```
 {config.formatting.custom_rules}
 ```
-"""
+""")
 
-        content += """
+        parts.append("""
 ### Testing Approach
-"""
+""")
 
         if config.testing.use_pytest:
-            content += """
+            parts.append("""
 - Use pytest for unit testing and integration testing
 - Write comprehensive test coverage for new features
 - Follow test-driven development practices where appropriate
-"""
+""")
 
         if config.testing.use_docker:
-            content += """
+            parts.append("""
 - Use Docker for consistent testing environments
 - Ensure tests pass in containerized environments
 - Consider multi-stage Docker builds for testing
-"""
+""")
 
-        content += f"""
+        parts.append(f"""
 ### Environment Management
-"""
+""")
 
         if config.virtualization.preference == "poetry":
-            content += """
+            parts.append("""
 - Use Poetry for dependency management
 - Update pyproject.toml for new dependencies
 - Use `poetry install` for environment setup
 - Use `poetry add` for adding new dependencies
-"""
+""")
         elif config.virtualization.preference == "venv":
-            content += """
+            parts.append("""
 - Use Python venv for virtual environments
 - Update requirements.txt for new dependencies
 - Document environment setup in README
-"""
+""")
         elif config.virtualization.preference == "poetry_with_venv_docs":
-            content += """
+            parts.append("""
 - Primary: Use Poetry for dependency management
 - Alternative: Support venv setup for contributors
 - Maintain both pyproject.toml and requirements.txt when needed
-"""
+""")
 
-        content += """
+        parts.append("""
 ## AI Assistant Guidelines
 
 ### Efficiency and Collaboration
@@ -467,28 +495,28 @@ The project has specific formatting requirements:
 5. **Security**: Follow security best practices for file operations and user input
 
 ### Project-Specific Considerations
-"""
+""")
 
         if config.github.use_github_actions:
-            content += """
+            parts.append("""
 - **CI/CD Integration**: Ensure changes are compatible with GitHub Actions workflows
-"""
+""")
 
         if config.testing.local_testing != "none":
-            content += f"""
+            parts.append(f"""
 - **Testing Strategy**: Align with the project's {config.testing.local_testing} testing approach
-"""
+""")
 
-        content += f"""
+        parts.append(f"""
 - **Development Workflow**: Respect the {config.virtualization.preference} environment setup
-"""
+""")
 
         if config.formatting.custom_rules:
-            content += """
+            parts.append("""
 - **Custom Requirements**: Follow the project-specific formatting rules defined above
-"""
+""")
 
-        content += f"""
+        parts.append(f"""
 ### Current Project State
 - **Configuration Date**: {config.creation_date}
 - **Project Path**: {config.project_path}
@@ -496,6 +524,6 @@ The project has specific formatting requirements:
 ---
 
 *This guidance document was automatically generated based on project configuration. Update as the project evolves.*
-"""
+""")
 
-        return content
\ No newline at end of file
+        return "".join(parts)
\ No newline at end of file
@@ -12,7 +12,7 @@ from ..models.questionnaire_schema import (
     QuestionType,
     Choice,
 )
-from .yaml_questionnaire import YamlQuestionnaireLoader
+from .yaml_questionnaire import YamlQuestionnaireError, YamlQuestionnaireLoader
 
 
 class DynamicQuestionnaireEngine:
@@ -38,7 +38,8 @@ class DynamicQuestionnaireEngine:
     def collect_answers(
         self, 
         schema: QuestionnaireSchema, 
-        project_path: Path
+        project_path: Path,
+        answers_override: Optional[dict[str, Any]] = None
     ) -> dict[str, Any]:
         """
         Collect answers from user based on the questionnaire schema.
@@ -46,10 +47,19 @@ class DynamicQuestionnaireEngine:
         Args:
             schema: The questionnaire schema to process.
             project_path: Path to the project directory.
+            answers_override: Pre-supplied answers for non-interactive runs.
+                When given, no prompts are shown; answers to questions whose
+                conditions are not met are dropped and the rest validated.
             
         Returns:
             Dictionary of collected answers.
+            
+        Raises:
+            YamlQuestionnaireError: If answers_override fails validation.
         """
+        if answers_override is not None:
+            return self._apply_answers_override(schema, answers_override)
+            
         # Display welcome message
         self.console.print(
             Panel.fit(
@@ -62,7 +72,7 @@ class DynamicQuestionnaireEngine:
         self.console.print(f"\n[bold]Project Path:[/bold] {project_path}")
         self.console.print()
 
-        answers = {}
+        answers: dict[str, Any] = {}
 
         # Process each section
         for section in schema.sections:
@@ -83,6 +93,22 @@ class DynamicQuestionnaireEngine:
 
         return answers
 
+    def _apply_answers_override(
+        self, schema: QuestionnaireSchema, answers_override: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Keep the supplied answers an interactive run would have asked for."""
+        answers: dict[str, Any] = {}
+        
+        # Conditions see only earlier answers, in question order, as when asking
+        for question in schema.get_all_questions():
+            if question.id in answers_override and question.evaluate_condition(answers):
+                answers[question.id] = answers_override[question.id]
+                
+        if not self.validate_answers(answers, schema):
+            raise YamlQuestionnaireError("Supplied answers failed questionnaire validation")
+            
+        return answers
+
     def _ask_question(self, question: Question, current_answers: dict[str, Any]) -> Any:
         """
         Ask a single question and return the answer.
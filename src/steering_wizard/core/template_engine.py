@@ -1,13 +1,20 @@
 """Jinja2 template engine for generating steering documents."""
 
+from collections import OrderedDict
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Optional, TextIO, Union
 from datetime import datetime
 import jinja2
 from rich.console import Console
 
 from ..models.questionnaire_schema import QuestionnaireSchema
 
+# Environments keyed by their resolved template directories, so engines set
+# up with the same directories reuse already compiled templates; least
+# recently used first
+_ENVIRONMENTS: "OrderedDict[tuple[str, ...], jinja2.Environment]" = OrderedDict()
+_ENVIRONMENTS_SIZE = 16
+
 
 class TemplateEngineError(Exception):
     """Base exception for template engine errors."""
@@ -21,32 +28,74 @@ class TemplateEngine:
         """Initialize the template engine."""
         self.console = console or Console()
         self.env = None
+        self._compiled: dict[str, jinja2.Template] = {}
 
     def setup_environment(self, template_dirs: list[Path]) -> None:
         """
         Set up Jinja2 environment with template directories.
         
+        Environments are shared between engines using the same directories
+        and do not reload templates that change on disk afterwards.
+        
         Args:
             template_dirs: List of directories to search for templates.
         """
         # Convert Path objects to strings for Jinja2
-        template_paths = [str(path) for path in template_dirs if path.exists()]
+        template_paths = tuple(
+            str(path.resolve()) for path in template_dirs if path.exists()
+        )
         
         if not template_paths:
             raise TemplateEngineError("No valid template directories found")
             
-        # Create Jinja2 environment
-        loader = jinja2.FileSystemLoader(template_paths)
-        self.env = jinja2.Environment(
-            loader=loader,
-            autoescape=jinja2.select_autoescape(['html', 'xml']),
-            trim_blocks=True,
-            lstrip_blocks=True
-        )
+        env = _ENVIRONMENTS.get(template_paths)
+        if env is None:
+            # Create Jinja2 environment; compiled templates are also kept in
+            # Jinja2's per-user bytecode cache between runs when it is usable
+            loader = jinja2.FileSystemLoader(list(template_paths))
+            env = jinja2.Environment(
+                loader=loader,
+                autoescape=jinja2.select_autoescape(['html', 'xml']),
+                trim_blocks=True,
+                lstrip_blocks=True,
+                auto_reload=False,
+                bytecode_cache=self._create_bytecode_cache()
+            )
+            
+            # Add custom filters; static so the shared environment does not
+            # keep this engine alive
+            env.filters['datetime'] = self._format_datetime
+            env.filters['yesno'] = self._format_boolean
+            _ENVIRONMENTS[template_paths] = env
+            if len(_ENVIRONMENTS) > _ENVIRONMENTS_SIZE:
+                _ENVIRONMENTS.popitem(last=False)
+        else:
+            _ENVIRONMENTS.move_to_end(template_paths)
+            
+        self.env = env
+        self._compiled = {}
+
+    @staticmethod
+    def _create_bytecode_cache() -> Optional[jinja2.BytecodeCache]:
+        """Create Jinja2's per-user bytecode cache, or None if its directory is unusable."""
+        try:
+            return jinja2.FileSystemBytecodeCache()
+        except (RuntimeError, OSError):
+            return None
+
+    def preload(self, schema: QuestionnaireSchema) -> None:
+        """
+        Compile every template referenced by a schema ahead of rendering.
         
-        # Add custom filters
-        self.env.filters['datetime'] = self._format_datetime
-        self.env.filters['yesno'] = self._format_boolean
+        Args:
+            schema: The questionnaire schema whose templates will be rendered.
+            
+        Raises:
+            TemplateEngineError: If a template is missing or has a syntax error.
+        """
+        for template_name in schema.templates.values():
+            if template_name not in self._compiled:
+                self._compiled[template_name] = self._load(template_name)
 
     def render_template(
         self, 
@@ -70,44 +119,12 @@ class TemplateEngine:
         Raises:
             TemplateEngineError: If rendering fails.
         """
-        if not self.env:
-            raise TemplateEngineError("Template environment not set up. Call setup_environment() first.")
-            
-        try:
-            template = self.env.get_template(template_name)
-        except jinja2.TemplateNotFound:
-            raise TemplateEngineError(f"Template not found: {template_name}")
-        except jinja2.TemplateSyntaxError as e:
-            raise TemplateEngineError(f"Template syntax error in {template_name}: {e}")
-            
-        # Prepare template context
-        context = {
-            'answers': answers,
-            'metadata': schema.metadata,
-            'project_path': project_path,
-            'creation_date': datetime.now().strftime('%Y-%m-%d'),
-            'creation_datetime': datetime.now(),
-        }
-        
-        # Add helper functions to context
-        context.update({
-            'get_answer': lambda key, default=None: answers.get(key, default),
-            'has_answer': lambda key: key in answers and answers[key],
-            'is_true': lambda key: answers.get(key, False) is True,
-            'is_false': lambda key: answers.get(key, True) is False,
-        })
-        
-        try:
-            return template.render(**context)
-        except jinja2.TemplateRuntimeError as e:
-            raise TemplateEngineError(f"Template rendering error in {template_name}: {e}")
-        except Exception as e:
-            raise TemplateEngineError(f"Unexpected error rendering {template_name}: {e}")
+        return self._render(template_name, self._build_context(answers, schema, project_path))
 
     def render_to_file(
         self,
         template_name: str,
-        output_path: Path,
+        output_path: Union[Path, TextIO],
         answers: dict[str, Any],
         schema: QuestionnaireSchema,
         project_path: Path
@@ -117,7 +134,8 @@ class TemplateEngine:
         
         Args:
             template_name: Name of the template file.
-            output_path: Path to write the rendered content.
+            output_path: Path to write the rendered content, or an open text
+                stream to write it to.
             answers: Dictionary of questionnaire answers.
             schema: The questionnaire schema.
             project_path: Path to the project directory.
@@ -126,7 +144,83 @@ class TemplateEngine:
             TemplateEngineError: If rendering or writing fails.
         """
         content = self.render_template(template_name, answers, schema, project_path)
+        if hasattr(output_path, "write"):
+            output_path.write(content)
+        else:
+            self._write(content, output_path)
+
+    def render_many(
+        self,
+        outputs: list[tuple[str, Path]],
+        answers: dict[str, Any],
+        schema: QuestionnaireSchema,
+        project_path: Path
+    ) -> None:
+        """
+        Render several templates with one shared context and write each to a file.
+        
+        Args:
+            outputs: (template_name, output_path) pairs, rendered in order.
+            answers: Dictionary of questionnaire answers.
+            schema: The questionnaire schema.
+            project_path: Path to the project directory.
+            
+        Raises:
+            TemplateEngineError: If rendering or writing any template fails.
+        """
+        context = self._build_context(answers, schema, project_path)
         
+        for template_name, output_path in outputs:
+            self._write(self._render(template_name, context), output_path)
+
+    def _build_context(
+        self,
+        answers: dict[str, Any],
+        schema: QuestionnaireSchema,
+        project_path: Path
+    ) -> dict[str, Any]:
+        """Build the template context shared by every template of one render."""
+        now = datetime.now()
+        context: dict[str, Any] = {
+            'answers': answers,
+            'metadata': schema.metadata,
+            'project_path': project_path,
+            'creation_date': now.strftime('%Y-%m-%d'),
+            'creation_datetime': now,
+            # Helper functions
+            'get_answer': lambda key, default=None: answers.get(key, default),
+            'has_answer': lambda key: key in answers and answers[key],
+            'is_true': lambda key: answers.get(key, False) is True,
+            'is_false': lambda key: answers.get(key, True) is False,
+        }
+        
+        return context
+
+    def _render(self, template_name: str, context: dict[str, Any]) -> str:
+        """Load and render one template, mapping Jinja2 errors to TemplateEngineError."""
+        template = self._compiled.get(template_name) or self._load(template_name)
+            
+        try:
+            return template.render(**context)
+        except jinja2.TemplateRuntimeError as e:
+            raise TemplateEngineError(f"Template rendering error in {template_name}: {e}")
+        except Exception as e:
+            raise TemplateEngineError(f"Unexpected error rendering {template_name}: {e}")
+
+    def _load(self, template_name: str) -> jinja2.Template:
+        """Fetch one compiled template from the environment."""
+        if not self.env:
+            raise TemplateEngineError("Template environment not set up. Call setup_environment() first.")
+            
+        try:
+            return self.env.get_template(template_name)
+        except jinja2.TemplateNotFound:
+            raise TemplateEngineError(f"Template not found: {template_name}")
+        except jinja2.TemplateSyntaxError as e:
+            raise TemplateEngineError(f"Template syntax error in {template_name}: {e}")
+
+    def _write(self, content: str, output_path: Path) -> None:
+        """Write rendered content, creating the parent directory if needed."""
         try:
             # Ensure parent directory exists
             output_path.parent.mkdir(parents=True, exist_ok=True)
@@ -185,12 +279,14 @@ class TemplateEngine:
         except Exception as e:
             return False, f"Error reading template: {e}"
 
-    def _format_datetime(self, dt: datetime, format_string: str = '%Y-%m-%d %H:%M:%S') -> str:
+    @staticmethod
+    def _format_datetime(dt: datetime, format_string: str = '%Y-%m-%d %H:%M:%S') -> str:
         """Jinja2 filter to format datetime objects."""
         if isinstance(dt, datetime):
             return dt.strftime(format_string)
         return str(dt)
 
-    def _format_boolean(self, value: Any, true_text: str = 'Yes', false_text: str = 'No') -> str:
+    @staticmethod
+    def _format_boolean(value: Any, true_text: str = 'Yes', false_text: str = 'No') -> str:
         """Jinja2 filter to format boolean values as Yes/No."""
         return true_text if value else false_text
\ No newline at end of file
@@ -1,5 +1,10 @@
 """YAML questionnaire loader and processor."""
 
+import hashlib
+import re
+import sys
+from collections import OrderedDict
+from functools import lru_cache
 import yaml
 from pathlib import Path
 from typing import Any, Optional
@@ -16,6 +21,13 @@ from ..models.questionnaire_schema import (
     QuestionType,
 )
 
+# Use the libyaml-backed safe loader when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Parsed schemas keyed by a digest of the file bytes, least recently used first
+_SCHEMA_CACHE: "OrderedDict[bytes, QuestionnaireSchema]" = OrderedDict()
+_SCHEMA_CACHE_SIZE = 128
+
 
 class YamlQuestionnaireError(Exception):
     """Base exception for YAML questionnaire errors."""
@@ -105,6 +117,9 @@ class YamlQuestionnaireLoader:
         """
         Load questionnaire from YAML file.
         
+        Files with identical content share one parsed schema, so callers
+        should treat the returned schema as read-only.
+        
         Args:
             yaml_path: Path to the YAML file.
             
@@ -118,13 +133,48 @@ class YamlQuestionnaireLoader:
             raise YamlQuestionnaireError(f"Questionnaire file not found: {yaml_path}")
             
         try:
-            with open(yaml_path, 'r', encoding='utf-8') as f:
-                yaml_data = yaml.safe_load(f)
-        except yaml.YAMLError as e:
-            raise YamlQuestionnaireError(f"Invalid YAML syntax: {e}")
+            content = yaml_path.read_bytes()
         except Exception as e:
             raise YamlQuestionnaireError(f"Error reading file: {e}")
             
+        digest = hashlib.blake2b(content, digest_size=16).digest()
+        cached = _SCHEMA_CACHE.get(digest)
+        if cached is not None:
+            _SCHEMA_CACHE.move_to_end(digest)
+            return cached
+            
+        try:
+            text = content.decode('utf-8')
+        except UnicodeDecodeError as e:
+            raise YamlQuestionnaireError(f"Error reading file: {e}")
+            
+        schema = self.load_from_string(text)
+        
+        # Only successfully validated schemas are cached
+        _SCHEMA_CACHE[digest] = schema
+        if len(_SCHEMA_CACHE) > _SCHEMA_CACHE_SIZE:
+            _SCHEMA_CACHE.popitem(last=False)
+            
+        return schema
+
+    def load_from_string(self, yaml_text: str) -> QuestionnaireSchema:
+        """
+        Load questionnaire from YAML text.
+        
+        Args:
+            yaml_text: YAML document containing the questionnaire.
+            
+        Returns:
+            Parsed QuestionnaireSchema.
+            
+        Raises:
+            YamlQuestionnaireError: If parsing or validation fails.
+        """
+        try:
+            yaml_data = yaml.load(yaml_text, Loader=_YAML_LOADER)
+        except yaml.YAMLError as e:
+            raise YamlQuestionnaireError(f"Invalid YAML syntax: {e}")
+            
         return self.load_from_dict(yaml_data)
 
     def load_from_dict(self, yaml_data: dict[str, Any]) -> QuestionnaireSchema:
@@ -140,11 +190,13 @@ class YamlQuestionnaireLoader:
         Raises:
             YamlQuestionnaireError: If validation fails.
         """
-        # Validate against JSON schema
-        try:
-            jsonschema.validate(yaml_data, self.YAML_SCHEMA)
-        except jsonschema.ValidationError as e:
-            raise YamlQuestionnaireError(f"Schema validation failed: {e.message}")
+        # Validate against JSON schema, reporting the same error
+        # jsonschema.validate would
+        error = jsonschema.exceptions.best_match(
+            self._schema_validator().iter_errors(yaml_data)
+        )
+        if error is not None:
+            raise YamlQuestionnaireError(f"Schema validation failed: {error.message}")
             
         # Parse metadata
         metadata_data = yaml_data["metadata"]
@@ -163,7 +215,7 @@ class YamlQuestionnaireLoader:
                 questions.append(question)
                 
             section = Section(
-                name=section_data["name"],
+                name=sys.intern(section_data["name"]),
                 title=section_data["title"],
                 questions=questions
             )
@@ -186,6 +238,12 @@ class YamlQuestionnaireLoader:
             
         return schema
 
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _schema_validator(cls) -> Any:
+        """Build the YAML_SCHEMA validator on first use and reuse it for every load."""
+        return jsonschema.validators.validator_for(cls.YAML_SCHEMA)(cls.YAML_SCHEMA)
+
     def _parse_question(self, question_data: dict[str, Any]) -> Question:
         """Parse a single question from YAML data."""
         # Parse question type
@@ -194,13 +252,14 @@ class YamlQuestionnaireLoader:
         except ValueError:
             raise YamlQuestionnaireError(f"Invalid question type: {question_data['type']}")
             
-        # Parse choices for choice questions
+        # Parse choices for choice questions; identifiers recur across
+        # questionnaires and answers, so they are interned
         choices = []
         if "choices" in question_data:
             for choice_data in question_data["choices"]:
                 choice = Choice(
-                    value=choice_data["value"],
-                    label=choice_data["label"],
+                    value=sys.intern(choice_data["value"]),
+                    label=sys.intern(choice_data["label"]),
                     default=choice_data.get("default", False)
                 )
                 choices.append(choice)
@@ -209,17 +268,22 @@ class YamlQuestionnaireLoader:
         validation = None
         if "validation" in question_data:
             validation_data = question_data["validation"]
-            validation = ValidationRule(
-                regex=validation_data.get("regex"),
-                error_message=validation_data.get("error_message"),
-                min_length=validation_data.get("min_length"),
-                max_length=validation_data.get("max_length"),
-                required=validation_data.get("required", True)
-            )
+            try:
+                validation = ValidationRule(
+                    regex=validation_data.get("regex"),
+                    error_message=validation_data.get("error_message"),
+                    min_length=validation_data.get("min_length"),
+                    max_length=validation_data.get("max_length"),
+                    required=validation_data.get("required", True)
+                )
+            except re.error as e:
+                raise YamlQuestionnaireError(
+                    f"Invalid regex for question '{question_data['id']}': {e}"
+                )
             
         # Create question
         question = Question(
-            id=question_data["id"],
+            id=sys.intern(question_data["id"]),
             type=question_type,
             prompt=question_data["prompt"],
             choices=choices,
@@ -1,6 +1,7 @@
 """Main CLI interface for the Steering Docs Wizard."""
 
 import sys
+from dataclasses import replace
 from pathlib import Path
 from typing import Optional, Any, Dict
 
@@ -17,6 +18,7 @@ from .core.document_generator import DocumentGenerator, DocumentGeneratorError,
 from .core.dynamic_questionnaire import DynamicQuestionnaireEngine
 from .core.template_engine import TemplateEngine, TemplateEngineError
 from .core.yaml_questionnaire import YamlQuestionnaireLoader, YamlQuestionnaireError
+from .models.config import ProjectConfiguration
 
 # Global console for consistent output formatting
 console = Console()
@@ -93,8 +95,29 @@ def main(
     run_wizard(target_dir, dry_run, questionnaire)
 
 
-def run_wizard(target_dir: Optional[Path], dry_run: bool, questionnaire_path: Optional[Path]) -> None:
-    """Run the main wizard logic."""
+def run_wizard(
+    target_dir: Optional[Path],
+    dry_run: bool,
+    questionnaire_path: Optional[Path] = None,
+    config: Optional[ProjectConfiguration] = None,
+) -> None:
+    """
+    Run the main wizard logic.
+
+    Args:
+        target_dir: Optional target directory specified by user.
+        dry_run: Whether to only show what would be created.
+        questionnaire_path: Optional custom questionnaire YAML file.
+        config: Pre-built configuration to use instead of prompting for one.
+            Only supported with the built-in questionnaire. Its project_path
+            is ignored and replaced by the discovered project directory.
+
+    Raises:
+        ValueError: If both questionnaire_path and config are given.
+    """
+    if config is not None and questionnaire_path is not None:
+        raise ValueError("A pre-built config cannot be combined with a custom questionnaire")
+
     document_generator = None
     
     try:
@@ -139,49 +162,50 @@ def run_wizard(target_dir: Optional[Path], dry_run: bool, questionnaire_path: Op
         console.print("\n[bold cyan]Step 3: Configuration Collection[/bold cyan]")
         
         if use_yaml_questionnaire:
-            config, schema = _collect_yaml_configuration_with_recovery(
+            answers, schema = _collect_yaml_configuration_with_recovery(
                 dynamic_questionnaire, template_engine, questionnaire_path, project_path
             )
+        elif config is None:
+            project_config = _collect_configuration_with_recovery(questionnaire, project_path)
         else:
-            config = _collect_configuration_with_recovery(questionnaire, project_path)
-            schema = None
+            project_config = replace(config, project_path=project_path)
         
         # Step 5: Validate configuration
         if use_yaml_questionnaire:
-            if not dynamic_questionnaire.validate_answers(config, schema):
+            if not dynamic_questionnaire.validate_answers(answers, schema):
                 console.print("\n[red]Configuration validation failed. Please restart the wizard.[/red]")
                 _display_recovery_options()
                 sys.exit(1)
         else:
-            if not questionnaire.validate_all_responses(config):
+            if not questionnaire.validate_all_responses(project_config):
                 console.print("\n[red]Configuration validation failed. Please restart the wizard.[/red]")
                 _display_recovery_options()
                 sys.exit(1)
         
         # Step 6: Display configuration summary
         if use_yaml_questionnaire:
-            dynamic_questionnaire.display_answers_summary(config, schema)
+            dynamic_questionnaire.display_answers_summary(answers, schema)
         else:
-            questionnaire.display_configuration_summary(config)
+            questionnaire.display_configuration_summary(project_config)
         
         # Step 7: Generate documents
         console.print("\n[bold cyan]Step 4: Document Generation[/bold cyan]")
         if dry_run:
             if use_yaml_questionnaire:
-                _display_yaml_dry_run_summary(config, schema, steering_path)
+                _display_yaml_dry_run_summary(answers, schema, steering_path)
             else:
-                _display_dry_run_summary(config, steering_path)
+                _display_dry_run_summary(project_config, steering_path)
         else:
             if use_yaml_questionnaire:
-                _generate_yaml_documents_with_recovery(template_engine, config, schema, steering_path)
+                _generate_yaml_documents_with_recovery(template_engine, answers, schema, steering_path)
             else:
-                _generate_documents_with_recovery(document_generator, config, steering_path)
+                _generate_documents_with_recovery(document_generator, project_config, steering_path)
         
         # Step 8: Display success summary
         if use_yaml_questionnaire:
-            _display_yaml_success_summary(config, schema, steering_path, dry_run)
+            _display_yaml_success_summary(answers, schema, steering_path, dry_run)
         else:
-            _display_success_summary(config, steering_path, dry_run)
+            _display_success_summary(project_config, steering_path, dry_run)
         
     except KeyboardInterrupt:
         console.print("\n\n[yellow]Wizard interrupted by user.[/yellow]")
@@ -189,7 +213,7 @@ def run_wizard(target_dir: Optional[Path], dry_run: bool, questionnaire_path: Op
             document_generator.cleanup_on_interruption()
         console.print("[dim]Partial files have been cleaned up.[/dim]")
         sys.exit(1)
-    except (ProjectFinderError, DocumentGeneratorError, FileOverwriteError) as e:
+    except (ProjectFinderError, DocumentGeneratorError, FileOverwriteError, TemplateEngineError) as e:
         _handle_known_error(e, document_generator)
         sys.exit(1)
     except OSError as e:
@@ -577,6 +601,8 @@ def _handle_known_error(error: Exception, document_generator: Optional[DocumentG
         console.print("\n[dim]Document generation failed. Check file permissions and disk space.[/dim]")
     elif isinstance(error, FileOverwriteError):
         console.print("\n[dim]File overwrite was cancelled. Run again to retry.[/dim]")
+    elif isinstance(error, TemplateEngineError):
+        console.print("\n[dim]Template error. Check the templates referenced by the questionnaire.[/dim]")
 
 
 def _handle_filesystem_error(error: OSError, document_generator: Optional[DocumentGenerator]) -> None:
@@ -780,12 +806,18 @@ def _collect_yaml_configuration_with_recovery(
             ]
             template_engine.setup_environment(template_dirs)
             
+            # Compile the schema's templates now, so template errors show up
+            # before the user answers any questions
+            template_engine.preload(schema)
+            
             # Collect answers
             answers = dynamic_questionnaire.collect_answers(schema, project_path)
             
             return answers, schema
             
-        except (YamlQuestionnaireError, TemplateEngineError) as e:
+        except TemplateEngineError:
+            raise  # A broken template fails the same way on every attempt
+        except YamlQuestionnaireError as e:
             console.print(f"\n[red]Error loading questionnaire: {e}[/red]")
             if attempt < max_attempts - 1:
                 console.print(f"[yellow]Retrying... (Attempt {attempt + 2}/{max_attempts})[/yellow]")
@@ -825,7 +857,8 @@ def _generate_yaml_documents_with_recovery(
     Requirements: YAML template support
     """
     try:
-        # Generate documents based on template configuration
+        # Collect documents based on template configuration
+        outputs = []
         for doc_name, template_name in schema.templates.items():
             output_path = steering_path / f"{doc_name.replace('_', '-')}.md"
             
@@ -835,13 +868,15 @@ def _generate_yaml_documents_with_recovery(
                     console.print(f"[yellow]Skipped {output_path.name}[/yellow]")
                     continue
             
-            template_engine.render_to_file(
-                template_name,
-                output_path,
-                answers,
-                schema,
-                steering_path.parent.parent  # project path
-            )
+            outputs.append((template_name, output_path))
+            
+        # Render every confirmed document with one shared template context
+        template_engine.render_many(
+            outputs,
+            answers,
+            schema,
+            steering_path.parent.parent  # project path
+        )
             
     except TemplateEngineError as e:
         console.print(f"\n[red]Template error during document generation: {e}[/red]")
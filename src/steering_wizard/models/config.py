@@ -1,13 +1,23 @@
 """Configuration data models for the steering docs wizard."""
 
-from dataclasses import dataclass
-from pathlib import Path
-from typing import Optional
 import re
+from dataclasses import dataclass, field
 from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional
 
+# GitHub URL validation regex
+_GITHUB_URL_RE = re.compile(r"^https://github\.com/[a-zA-Z0-9_.-]+/[a-zA-Z0-9_.-]+/?$")
 
-@dataclass
+
+@lru_cache(maxsize=256)
+def _is_github_url(url: str) -> bool:
+    """Return whether url is a GitHub repository URL."""
+    return bool(_GITHUB_URL_RE.match(url))
+
+
+@dataclass(frozen=True, slots=True)
 class TestingConfig:
     """Configuration for testing preferences."""
 
@@ -21,7 +31,7 @@ class TestingConfig:
         return self.local_testing.lower() in valid_local_testing
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class GitHubConfig:
     """Configuration for GitHub integration."""
 
@@ -33,12 +43,10 @@ class GitHubConfig:
         if self.repository_url is None:
             return True
 
-        # GitHub URL validation regex
-        github_pattern = r"^https://github\.com/[a-zA-Z0-9_.-]+/[a-zA-Z0-9_.-]+/?$"
-        return bool(re.match(github_pattern, self.repository_url))
+        return _is_github_url(self.repository_url)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class FormattingConfig:
     """Configuration for code formatting preferences."""
 
@@ -52,7 +60,7 @@ class FormattingConfig:
         return True
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class VirtualizationConfig:
     """Configuration for virtualization preferences."""
 
@@ -65,7 +73,7 @@ class VirtualizationConfig:
         return self.preference.lower() in valid_preferences
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ProjectConfiguration:
     """Complete project configuration containing all user preferences."""
 
@@ -75,17 +83,29 @@ class ProjectConfiguration:
     virtualization: VirtualizationConfig
     project_path: Path
     creation_date: str
+    # Cached result of the checks that only depend on the (immutable) fields
+    _fields_valid: Optional[bool] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def validate(self) -> bool:
-        """Validate the complete project configuration."""
-        return (
-            self.testing.validate()
-            and self.github.validate()
-            and self.formatting.validate()
-            and self.virtualization.validate()
-            and self.project_path.exists()
-            and self._validate_date_format()
-        )
+        """
+        Validate the complete project configuration.
+
+        The sub-configuration and date checks are computed once and reused;
+        the project path is checked on every call since it can change on disk.
+        """
+        if self._fields_valid is None:
+            object.__setattr__(
+                self,
+                "_fields_valid",
+                self.testing.validate()
+                and self.github.validate()
+                and self.formatting.validate()
+                and self.virtualization.validate()
+                and self._validate_date_format(),
+            )
+        return bool(self._fields_valid) and self.project_path.exists()
 
     def _validate_date_format(self) -> bool:
         """Validate that creation_date is in YYYY-MM-DD format."""
@@ -1,7 +1,8 @@
 """YAML questionnaire schema models and validation."""
 
+from collections import Counter
 from dataclasses import dataclass, field
-from typing import List, Optional, Dict, Any, Union
+from typing import List, Optional, Dict, Any, Pattern, Union
 from enum import Enum
 import re
 
@@ -14,7 +15,7 @@ class QuestionType(Enum):
     MULTILINE = "multiline"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ValidationRule:
     """Validation rules for question responses."""
     regex: Optional[str] = None
@@ -22,6 +23,14 @@ class ValidationRule:
     min_length: Optional[int] = None
     max_length: Optional[int] = None
     required: bool = True
+    _compiled: Optional[Pattern[str]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        """Compile the regex once so each validated answer reuses it."""
+        if self.regex:
+            object.__setattr__(self, "_compiled", re.compile(self.regex))
 
     def validate(self, value: str) -> tuple[bool, Optional[str]]:
         """
@@ -45,14 +54,14 @@ class ValidationRule:
         if self.max_length and len(value) > self.max_length:
             return False, f"Maximum length is {self.max_length} characters"
             
-        if self.regex:
-            if not re.match(self.regex, value):
+        if self._compiled is not None:
+            if not self._compiled.match(value):
                 return False, self.error_message or "Invalid format"
                 
         return True, None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Choice:
     """A choice option for choice-type questions."""
     value: str
@@ -60,7 +69,7 @@ class Choice:
     default: bool = False
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Question:
     """A single question in the questionnaire."""
     id: str
@@ -72,6 +81,32 @@ class Question:
     retry_attempts: int = 3
     optional: bool = False
     default_value: Optional[Union[str, bool]] = None
+    _parsed_condition: Optional[tuple[str, Union[str, bool]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        """Parse the condition once so each evaluation is a lookup and compare."""
+        if not self.condition:
+            return
+            
+        # Parse condition like "use_black == true" or "local_testing == 'docker'"
+        parts = self.condition.split(" == ")
+        if len(parts) != 2:
+            return  # Invalid condition, evaluated as always shown
+            
+        var_name = parts[0].strip()
+        expected_value = parts[1].strip()
+        
+        # Boolean values compare as bools, anything else as an unquoted string
+        if expected_value.lower() in ["true", "false"]:
+            object.__setattr__(
+                self, "_parsed_condition", (var_name, expected_value.lower() == "true")
+            )
+        else:
+            object.__setattr__(
+                self, "_parsed_condition", (var_name, expected_value.strip("'\""))
+            )
 
     def evaluate_condition(self, answers: Dict[str, Any]) -> bool:
         """
@@ -88,34 +123,23 @@ class Question:
             
         # Simple condition evaluation (can be extended)
         # Format: "variable_name == 'value'" or "variable_name == true"
-        try:
-            # Parse condition like "use_black == true" or "local_testing == 'docker'"
-            parts = self.condition.split(" == ")
-            if len(parts) != 2:
-                return True  # Invalid condition, show question
-                
-            var_name = parts[0].strip()
-            expected_value = parts[1].strip()
+        if self._parsed_condition is None:
+            return True  # Invalid condition, show question
             
-            if var_name not in answers:
-                return False  # Variable not set yet
-                
-            actual_value = answers[var_name]
-            
-            # Handle boolean values
-            if expected_value.lower() in ["true", "false"]:
-                expected_bool = expected_value.lower() == "true"
-                return actual_value == expected_bool
-                
-            # Handle string values (remove quotes if present)
-            expected_str = expected_value.strip("'\"")
-            return str(actual_value) == expected_str
+        var_name, expected = self._parsed_condition
+        if var_name not in answers:
+            return False  # Variable not set yet
             
+        try:
+            actual_value = answers[var_name]
+            if isinstance(expected, bool):
+                return actual_value == expected
+            return str(actual_value) == expected
         except Exception:
             return True  # On error, show the question
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Section:
     """A section containing related questions."""
     name: str
@@ -123,7 +147,7 @@ class Section:
     questions: List[Question] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class QuestionnaireMetadata:
     """Metadata about the questionnaire."""
     name: str
@@ -131,7 +155,7 @@ class QuestionnaireMetadata:
     description: str
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class QuestionnaireSchema:
     """Complete questionnaire schema."""
     metadata: QuestionnaireMetadata
@@ -160,25 +184,26 @@ class QuestionnaireSchema:
             List of validation errors (empty if valid).
         """
         errors = []
+        all_questions = self.get_all_questions()
         
         # Check for duplicate question IDs
-        question_ids = [q.id for q in self.get_all_questions()]
-        if len(question_ids) != len(set(question_ids)):
-            duplicates = [qid for qid in set(question_ids) if question_ids.count(qid) > 1]
+        id_counts = Counter(q.id for q in all_questions)
+        duplicates = [qid for qid, count in id_counts.items() if count > 1]
+        if duplicates:
             errors.append(f"Duplicate question IDs found: {duplicates}")
             
         # Validate conditions reference existing questions
-        for question in self.get_all_questions():
+        for question in all_questions:
             if question.condition:
                 try:
                     var_name = question.condition.split(" == ")[0].strip()
-                    if not any(q.id == var_name for q in self.get_all_questions()):
+                    if var_name not in id_counts:
                         errors.append(f"Question '{question.id}' references unknown variable '{var_name}' in condition")
                 except Exception:
                     errors.append(f"Question '{question.id}' has invalid condition format: {question.condition}")
                     
         # Validate choice questions have choices
-        for question in self.get_all_questions():
+        for question in all_questions:
             if question.type == QuestionType.CHOICE and not question.choices:
                 errors.append(f"Choice question '{question.id}' has no choices defined")
                 
@@ -1,27 +1,48 @@
 """Pytest configuration and shared fixtures."""
 
+import os
+
 import pytest
 from pathlib import Path
-import tempfile
-import shutil
-from typing import Generator
+from hypothesis import settings
 
+from steering_wizard.core.project_finder import ProjectFinder
 
-@pytest.fixture
-def temp_dir() -> Generator[Path, None, None]:
-    """Create a temporary directory for testing."""
-    temp_path = Path(tempfile.mkdtemp())
-    try:
-        yield temp_path
-    finally:
-        shutil.rmtree(temp_path, ignore_errors=True)
+from .helpers import FrozenDatetime, NullConsole
+
+# CI runs skip the on-disk example database and draw examples
+# deterministically; property tests with their own @settings keep them
+settings.register_profile(
+    "ci", database=None, derandomize=True, print_blob=False, max_examples=25
+)
+settings.load_profile("ci" if os.getenv("CI") else "default")
+
+
+@pytest.fixture(scope="session", autouse=True)
+def frozen_config_clock():
+    """Freeze the clock used for configuration creation dates for the session."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("steering_wizard.models.config.datetime", FrozenDatetime)
+        yield
+
+
+@pytest.fixture(scope="session")
+def null_console() -> NullConsole:
+    """Provide one no-op console for tests that never assert on output."""
+    return NullConsole()
+
+
+@pytest.fixture(scope="session")
+def finder() -> ProjectFinder:
+    """Provide one ProjectFinder for the session; it keeps no state."""
+    return ProjectFinder()
 
 
 @pytest.fixture
-def mock_kiro_project(temp_dir: Path) -> Path:
+def mock_kiro_project(tmp_path: Path) -> Path:
     """Create a mock Kiro project structure for testing."""
-    kiro_dir = temp_dir / ".kiro"
+    kiro_dir = tmp_path / ".kiro"
     kiro_dir.mkdir()
     steering_dir = kiro_dir / "steering"
     steering_dir.mkdir()
-    return temp_dir
+    return tmp_path
@@ -0,0 +1,80 @@
+"""Shared helpers for building and generating test configurations."""
+
+import functools
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+from hypothesis import strategies as st
+
+from steering_wizard.models.config import (
+    TestingConfig,
+    GitHubConfig,
+    FormattingConfig,
+    VirtualizationConfig,
+    ProjectConfiguration,
+)
+
+# Clock reading every test sees through steering_wizard.models.config
+FROZEN_NOW = datetime(2024, 1, 1, 12, 0, 0)
+FROZEN_DATE = FROZEN_NOW.strftime("%Y-%m-%d")
+
+
+class FrozenDatetime(datetime):
+    """datetime whose now() always returns FROZEN_NOW."""
+
+    @classmethod
+    def now(cls, tz=None):
+        return FROZEN_NOW
+
+
+class NullConsole:
+    """Console stand-in whose print does nothing, for tests that ignore output."""
+
+    def print(self, *args, **kwargs) -> None:
+        pass
+
+
+# Strategies shared by the configuration property tests
+LOCAL_TESTING_ST = st.sampled_from(["docker", "pytest", "both", "none"])
+PREFERENCE_ST = st.sampled_from(["venv", "poetry", "poetry_with_venv_docs"])
+
+
+@functools.lru_cache(maxsize=512)
+def build_project_config(
+    local_testing: str,
+    use_docker: bool,
+    use_pytest: bool,
+    repository_url: Optional[str],
+    use_github_actions: bool,
+    use_black: bool,
+    use_google_style: bool,
+    custom_rules: Optional[str],
+    preference: str,
+    include_venv_docs: bool,
+    project_path: Path,
+) -> ProjectConfiguration:
+    """
+    Build a ProjectConfiguration from primitive values.
+
+    Results are memoized so Hypothesis examples that repeat the same inputs
+    (common while shrinking) reuse one configuration. Callers must treat the
+    returned object as read-only.
+    """
+    return ProjectConfiguration.create_with_current_date(
+        testing=TestingConfig(
+            local_testing=local_testing, use_docker=use_docker, use_pytest=use_pytest
+        ),
+        github=GitHubConfig(
+            repository_url=repository_url, use_github_actions=use_github_actions
+        ),
+        formatting=FormattingConfig(
+            use_black=use_black,
+            use_google_style=use_google_style,
+            custom_rules=custom_rules,
+        ),
+        virtualization=VirtualizationConfig(
+            preference=preference, include_venv_docs=include_venv_docs
+        ),
+        project_path=project_path,
+    )
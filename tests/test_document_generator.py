@@ -1,13 +1,17 @@
 """Tests for document_generator module."""
 
-import pytest
+import os
+import re
+import string
 import tempfile
-import shutil
+import pytest
 from pathlib import Path
-from unittest.mock import Mock, patch
-from hypothesis import given, strategies as st
+from typing import Iterator
+from unittest.mock import Mock
+from hypothesis import HealthCheck, Phase, given, settings, strategies as st
+from rich.console import Console
 
-from steering_wizard.core.document_generator import DocumentGenerator, DocumentGeneratorError, FileOverwriteError
+from steering_wizard.core.document_generator import DocumentGenerator, FileOverwriteError
 from steering_wizard.models.config import (
     TestingConfig,
     GitHubConfig,
@@ -16,6 +20,34 @@ from steering_wizard.models.config import (
     ProjectConfiguration,
 )
 
+from .helpers import LOCAL_TESTING_ST, PREFERENCE_ST, NullConsole, build_project_config
+
+
+@pytest.fixture(scope="module")
+def mock_console() -> Mock:
+    """
+    Provide one Console stand-in shared by every test in this module.
+
+    Tests that assert on console calls should call reset_mock() first.
+    """
+    return Mock(spec=Console)
+
+
+@pytest.fixture
+def confirm_yes(monkeypatch):
+    """Answer yes to every overwrite confirmation prompt."""
+    monkeypatch.setattr(
+        "steering_wizard.core.document_generator.Confirm.ask", lambda *args, **kwargs: True
+    )
+
+
+@pytest.fixture
+def confirm_no(monkeypatch):
+    """Answer no to every overwrite confirmation prompt."""
+    monkeypatch.setattr(
+        "steering_wizard.core.document_generator.Confirm.ask", lambda *args, **kwargs: False
+    )
+
 
 class TestDocumentGenerator:
     """Test cases for DocumentGenerator functionality."""
@@ -26,16 +58,16 @@ class TestDocumentGenerator:
         assert generator is not None
         assert generator.console is not None
 
-    def test_check_existing_files(self, temp_dir):
+    def test_check_existing_files(self, tmp_path):
         """Test checking for existing files."""
         generator = DocumentGenerator()
         
         # Create some existing files
-        (temp_dir / "development-guidelines.md").touch()
-        (temp_dir / "llm-guidance.md").touch()
-        (temp_dir / "other-file.md").touch()
+        (tmp_path / "development-guidelines.md").touch()
+        (tmp_path / "llm-guidance.md").touch()
+        (tmp_path / "other-file.md").touch()
         
-        existing_files = generator.check_existing_files(temp_dir)
+        existing_files = generator.check_existing_files(tmp_path)
         
         # Should find the two standard files but not the other file
         assert len(existing_files) == 2
@@ -44,78 +76,99 @@ class TestDocumentGenerator:
         assert "llm-guidance.md" in file_names
         assert "other-file.md" not in file_names
 
-    def test_file_overwrite_confirmation_denied(self, temp_dir):
+    def test_iter_existing_files_is_lazy(self, tmp_path):
+        """Test that existing files are yielded lazily from one directory scan."""
+        generator = DocumentGenerator()
+        (tmp_path / "llm-guidance.md").touch()
+        (tmp_path / "other-file.md").touch()
+
+        existing_files = generator.iter_existing_files(tmp_path)
+
+        assert not isinstance(existing_files, list)
+        assert list(existing_files) == [tmp_path / "llm-guidance.md"]
+
+    def test_check_existing_files_missing_directory(self, tmp_path):
+        """Test that a steering directory that doesn't exist yet has no existing files."""
+        generator = DocumentGenerator()
+
+        assert generator.check_existing_files(tmp_path / "missing") == []
+
+    def test_check_existing_files_unlistable_directory(self, tmp_path, monkeypatch):
+        """Test that a directory without read permission is checked file by file."""
+        real_scandir = os.scandir
+
+        # Only the steering directory is unreadable; every other caller of
+        # os.scandir keeps working while the patch is active
+        def scandir(path="."):
+            if Path(path) == tmp_path:
+                raise PermissionError(13, "Permission denied", str(path))
+            return real_scandir(path)
+
+        monkeypatch.setattr(os, "scandir", scandir)
+        generator = DocumentGenerator()
+        (tmp_path / "llm-guidance.md").touch()
+
+        assert generator.check_existing_files(tmp_path) == [tmp_path / "llm-guidance.md"]
+
+    def test_file_overwrite_confirmation_denied(self, tmp_path, mock_console, confirm_no):
         """
         Test existing file detection and user confirmation when denied.
         
         Requirements: 3.4, 4.5, 5.3
         """
-        # Create a mock console that denies overwrite
-        mock_console = Mock()
-        mock_console.print = Mock()
-        
         generator = DocumentGenerator(console=mock_console)
         
-        # Mock the Confirm.ask to return False (deny overwrite)
-        with patch('steering_wizard.core.document_generator.Confirm.ask', return_value=False):
-            # Create existing file
-            existing_file = temp_dir / "development-guidelines.md"
-            existing_file.write_text("existing content")
-            
-            # Create a simple configuration
-            config = self._create_test_config(temp_dir)
-            
-            # Attempt to generate file should raise FileOverwriteError
-            with pytest.raises(FileOverwriteError):
-                generator.generate_development_guidelines(config, existing_file)
-            
-            # File should still contain original content
-            assert existing_file.read_text() == "existing content"
+        # Create existing file
+        existing_file = tmp_path / "development-guidelines.md"
+        existing_file.write_text("existing content")
+        
+        # Create a simple configuration
+        config = self._create_test_config(tmp_path)
+        
+        # Attempt to generate file should raise FileOverwriteError
+        with pytest.raises(FileOverwriteError):
+            generator.generate_development_guidelines(config, existing_file)
+        
+        # File should still contain original content
+        assert existing_file.read_text() == "existing content"
 
-    def test_file_overwrite_confirmation_accepted(self, temp_dir):
+    def test_file_overwrite_confirmation_accepted(self, tmp_path, mock_console, confirm_yes):
         """
         Test existing file detection and user confirmation when accepted.
         
         Requirements: 3.4, 4.5
         """
-        # Create a mock console that accepts overwrite
-        mock_console = Mock()
-        mock_console.print = Mock()
-        
         generator = DocumentGenerator(console=mock_console)
         
-        # Mock the Confirm.ask to return True (accept overwrite)
-        with patch('steering_wizard.core.document_generator.Confirm.ask', return_value=True):
-            # Create existing file
-            existing_file = temp_dir / "development-guidelines.md"
-            existing_file.write_text("existing content")
-            
-            # Create a simple configuration
-            config = self._create_test_config(temp_dir)
-            
-            # Generate file should succeed
-            generator.generate_development_guidelines(config, existing_file)
-            
-            # File should contain new content
-            new_content = existing_file.read_text()
-            assert "existing content" not in new_content
-            assert "# Development Guidelines" in new_content
+        # Create existing file
+        existing_file = tmp_path / "development-guidelines.md"
+        existing_file.write_text("existing content")
+        
+        # Create a simple configuration
+        config = self._create_test_config(tmp_path)
+        
+        # Generate file should succeed
+        generator.generate_development_guidelines(config, existing_file)
+        
+        # File should contain new content
+        new_content = existing_file.read_text()
+        assert "existing content" not in new_content
+        assert "# Development Guidelines" in new_content
 
-    def test_file_cleanup_on_interruption(self, temp_dir):
+    def test_file_cleanup_on_interruption(self, tmp_path, mock_console):
         """
         Test file cleanup on interruption.
         
         Requirements: 5.3
         """
-        mock_console = Mock()
         generator = DocumentGenerator(console=mock_console)
         
         # Create test files that would be cleaned up
-        test_file1 = temp_dir / "development-guidelines.md"
-        test_file2 = temp_dir / "llm-guidance.md"
+        test_file1 = tmp_path / "development-guidelines.md"
+        test_file2 = tmp_path / "llm-guidance.md"
         
-        # Add files to cleanup list manually (simulating partial creation)
-        generator._cleanup_files = [test_file1, test_file2]
+        # Add files to cleanup set manually (simulating partial creation)
+        generator._cleanup_files = {test_file1, test_file2}
         
         # Create the files
         test_file1.write_text("partial content 1")
@@ -132,48 +185,46 @@ class TestDocumentGenerator:
         assert not test_file1.exists()
         assert not test_file2.exists()
         
-        # Verify cleanup list is cleared
+        # Verify cleanup set is cleared
         assert len(generator._cleanup_files) == 0
 
-    def test_file_cleanup_handles_missing_files(self, temp_dir):
+    def test_file_cleanup_handles_missing_files(self, tmp_path, mock_console):
         """
         Test file cleanup handles missing files gracefully.
         
         Requirements: 5.3
         """
-        mock_console = Mock()
         generator = DocumentGenerator(console=mock_console)
         
-        # Add non-existent files to cleanup list
-        non_existent_file = temp_dir / "non-existent.md"
-        generator._cleanup_files = [non_existent_file]
+        # Add non-existent files to cleanup set
+        non_existent_file = tmp_path / "non-existent.md"
+        generator._cleanup_files = {non_existent_file}
         
         # Cleanup should not raise an error
         generator._cleanup_partial_files()
         
-        # Verify cleanup list is cleared
+        # Verify cleanup set is cleared
         assert len(generator._cleanup_files) == 0
 
-    def test_successful_file_generation_removes_from_cleanup(self, temp_dir):
+    def test_successful_file_generation_removes_from_cleanup(self, tmp_path, mock_console):
         """
-        Test that successful file generation removes files from cleanup list.
+        Test that successful file generation removes files from cleanup set.
         
         Requirements: 5.3
         """
-        mock_console = Mock()
         generator = DocumentGenerator(console=mock_console)
         
         # Create a simple configuration
-        config = self._create_test_config(temp_dir)
+        config = self._create_test_config(tmp_path)
         
         # Generate file
-        output_file = temp_dir / "development-guidelines.md"
+        output_file = tmp_path / "development-guidelines.md"
         generator.generate_development_guidelines(config, output_file)
         
         # Verify file was created
         assert output_file.exists()
         
-        # Verify cleanup list is empty (file was removed after successful generation)
+        # Verify cleanup set is empty (file was removed after successful generation)
         assert len(generator._cleanup_files) == 0
 
     def _create_test_config(self, project_path: Path) -> ProjectConfiguration:
@@ -198,25 +249,102 @@ class TestDocumentGenerator:
         )
 
 
+# Fixed tokens the completeness property looks for, longest first so that
+# "poetry_with_venv_docs" is not consumed as "poetry". Everything is matched
+# against the raw file bytes, so the files never need decoding unless an
+# assertion fails.
+_EXPECTED_TOKENS = (
+    "# Development Guidelines",
+    "# LLM Development Guidance",
+    "docker",
+    "pytest",
+    "both",
+    "none",
+    "venv",
+    "poetry",
+    "poetry_with_venv_docs",
+    "Yes",
+    "No",
+)
+_EXPECTED_TOKEN_RE = re.compile(
+    b"|".join(
+        re.escape(token.encode("utf-8"))
+        for token in sorted(_EXPECTED_TOKENS, key=len, reverse=True)
+    )
+)
+
+
+def _find_tokens(content: bytes) -> set[str]:
+    """Return every expected token that occurs in content, in a single scan."""
+    return {match.group(0).decode("ascii") for match in _EXPECTED_TOKEN_RE.finditer(content)}
+
+
+def _encode_written(text: str) -> bytes:
+    """Encode text the way a text-mode UTF-8 write puts it on disk."""
+    if os.linesep != "\n" and "\n" in text:
+        text = text.replace("\n", os.linesep)
+    return text.encode("utf-8")
+
+
+# Only characters GitHubConfig accepts, so every drawn URL is valid
+REPO_NAME_ALPHABET = string.ascii_letters + string.digits + "_.-"
+REPO_URL_ST = st.one_of(
+    st.none(),
+    st.text(min_size=1, alphabet=REPO_NAME_ALPHABET).map(
+        lambda x: f"https://github.com/user/{x[:20]}"  # Limit length for valid URLs
+    ),
+)
+# Limit size for reasonable test performance
+CUSTOM_RULES_ST = st.one_of(st.none(), st.text(max_size=200))
+
+
+# Memory-backed filesystem for the generation property's output, if present
+TMPFS_ROOT = (
+    "/dev/shm"
+    if os.path.isdir("/dev/shm") and os.access("/dev/shm", os.W_OK)
+    else None
+)
+
+
+@pytest.fixture(scope="module")
+def generation_dir(tmp_path_factory) -> Iterator[Path]:
+    """
+    Provide one output directory shared by every generation example.
+
+    The directory lives on tmpfs when one is available, so the repeated small
+    writes of the property never touch the disk.
+    """
+    if TMPFS_ROOT is None:
+        yield tmp_path_factory.mktemp("generation")
+        return
+
+    with tempfile.TemporaryDirectory(prefix="generation-", dir=TMPFS_ROOT) as temp_dir:
+        yield Path(temp_dir)
+
+
 # Property-based test for File Generation Completeness
+@settings(
+    max_examples=25,
+    deadline=None,
+    database=None,
+    derandomize=True,
+    suppress_health_check=[HealthCheck.too_slow],
+    phases=(Phase.explicit, Phase.generate),
+)
 @given(
-    local_testing=st.sampled_from(["docker", "pytest", "both", "none"]),
+    local_testing=LOCAL_TESTING_ST,
     use_docker=st.booleans(),
     use_pytest=st.booleans(),
-    repository_url=st.one_of(
-        st.none(),
-        st.text(min_size=1, alphabet=st.characters(whitelist_categories=("Lu", "Ll", "Nd", "Pc"))).map(
-            lambda x: f"https://github.com/user/{x[:20]}"  # Limit length for valid URLs
-        ),
-    ),
+    repository_url=REPO_URL_ST,
     use_github_actions=st.booleans(),
     use_black=st.booleans(),
     use_google_style=st.booleans(),
-    custom_rules=st.one_of(st.none(), st.text(max_size=200)),  # Limit size for reasonable test performance
-    preference=st.sampled_from(["venv", "poetry", "poetry_with_venv_docs"]),
+    custom_rules=CUSTOM_RULES_ST,
+    preference=PREFERENCE_ST,
     include_venv_docs=st.booleans(),
 )
 def test_file_generation_completeness(
+    generation_dir,
     local_testing,
     use_docker,
     use_pytest,
@@ -238,49 +366,29 @@ def test_file_generation_completeness(
     **Feature: steering-docs-wizard, Property 4: File Generation Completeness**
     **Validates: Requirements 3.1, 3.5, 4.1, 4.2, 4.3**
     """
-    # Create a temporary directory for this test iteration
-    temp_path = Path(tempfile.mkdtemp())
+    temp_path = generation_dir
+    dev_guidelines_path = temp_path / "development-guidelines.md"
+    llm_guidance_path = temp_path / "llm-guidance.md"
     try:
-        # Create configuration objects with the generated data
-        testing = TestingConfig(
-            local_testing=local_testing, use_docker=use_docker, use_pytest=use_pytest
+        config = build_project_config(
+            local_testing,
+            use_docker,
+            use_pytest,
+            repository_url,
+            use_github_actions,
+            use_black,
+            use_google_style,
+            custom_rules,
+            preference,
+            include_venv_docs,
+            temp_path,
         )
 
-        github = GitHubConfig(
-            repository_url=repository_url, use_github_actions=use_github_actions
-        )
-
-        formatting = FormattingConfig(
-            use_black=use_black,
-            use_google_style=use_google_style,
-            custom_rules=custom_rules,
-        )
-
-        virtualization = VirtualizationConfig(
-            preference=preference, include_venv_docs=include_venv_docs
-        )
-
-        # Only test with valid configurations
-        if not (testing.validate() and github.validate() and formatting.validate() and virtualization.validate()):
-            return
-
-        # Create the complete configuration
-        config = ProjectConfiguration.create_with_current_date(
-            testing=testing,
-            github=github,
-            formatting=formatting,
-            virtualization=virtualization,
-            project_path=temp_path,
-        )
-
-        # Create document generator with mocked console to avoid interactive prompts
-        mock_console = Mock()
-        generator = DocumentGenerator(console=mock_console)
+        # Create document generator with a no-op console; nothing here asserts
+        # on output, so Mock call recording would be wasted work
+        generator = DocumentGenerator(console=NullConsole())
 
         # Generate both documents
-        dev_guidelines_path = temp_path / "development-guidelines.md"
-        llm_guidance_path = temp_path / "llm-guidance.md"
-
         generator.generate_development_guidelines(config, dev_guidelines_path)
         generator.generate_llm_guidance(config, llm_guidance_path)
 
@@ -288,55 +396,58 @@ def test_file_generation_completeness(
         assert dev_guidelines_path.exists(), "development-guidelines.md should be created"
         assert llm_guidance_path.exists(), "llm-guidance.md should be created"
 
+        # Encode the custom rules once for both documents, comparing against
+        # the bytes a text-mode write produces for them
+        custom_rules_bytes = (
+            _encode_written(custom_rules) if custom_rules and custom_rules.strip() else None
+        )
+
         # Read and verify content of development guidelines
-        dev_content = dev_guidelines_path.read_text(encoding='utf-8')
+        dev_content = dev_guidelines_path.read_bytes()
         
-        # Verify required sections and content preservation
-        assert "# Development Guidelines" in dev_content
-        assert config.creation_date in dev_content
-        assert local_testing in dev_content
-        
-        # Check for boolean values in the format the generator actually outputs
+        # Verify required sections and content preservation, checking the
+        # boolean values in the format the generator actually outputs
         docker_text = "Yes" if use_docker else "No"
         pytest_text = "Yes" if use_pytest else "No"
-        assert docker_text in dev_content
-        assert pytest_text in dev_content
+        dev_expected = {
+            "# Development Guidelines",
+            local_testing,
+            docker_text,
+            pytest_text,
+            preference,
+        }
+        assert dev_expected <= _find_tokens(dev_content), dev_content.decode("utf-8")
+        assert config.creation_date.encode("ascii") in dev_content
         
         if repository_url:
-            assert repository_url in dev_content
+            assert repository_url.encode("utf-8") in dev_content, dev_content.decode("utf-8")
         
-        if custom_rules and custom_rules.strip():
-            # Normalize line endings for comparison since file writing may normalize them
-            normalized_custom_rules = custom_rules.replace('\r\n', '\n').replace('\r', '\n')
-            assert normalized_custom_rules in dev_content
-            
-        assert preference in dev_content
+        if custom_rules_bytes:
+            assert custom_rules_bytes in dev_content, dev_content.decode("utf-8")
 
         # Read and verify content of LLM guidance
-        llm_content = llm_guidance_path.read_text(encoding='utf-8')
+        llm_content = llm_guidance_path.read_bytes()
         
         # Verify required sections and content preservation
-        assert "# LLM Development Guidance" in llm_content
-        assert config.creation_date in llm_content
-        assert local_testing in llm_content
-        assert preference in llm_content
+        llm_expected = {"# LLM Development Guidance", local_testing, preference}
+        assert llm_expected <= _find_tokens(llm_content), llm_content.decode("utf-8")
+        assert config.creation_date.encode("ascii") in llm_content
         
         if repository_url:
-            assert repository_url in llm_content
+            assert repository_url.encode("utf-8") in llm_content, llm_content.decode("utf-8")
             
-        if custom_rules and custom_rules.strip():
-            # Normalize line endings for comparison since file writing may normalize them
-            normalized_custom_rules = custom_rules.replace('\r\n', '\n').replace('\r', '\n')
-            assert normalized_custom_rules in llm_content
+        if custom_rules_bytes:
+            assert custom_rules_bytes in llm_content, llm_content.decode("utf-8")
 
         # Verify both files contain valid markdown structure
-        assert dev_content.startswith("# ")
-        assert llm_content.startswith("# ")
+        assert dev_content.startswith(b"# ")
+        assert llm_content.startswith(b"# ")
         
         # Verify files are not empty and have substantial content
         assert len(dev_content) > 100, "Development guidelines should have substantial content"
         assert len(llm_content) > 100, "LLM guidance should have substantial content"
 
     finally:
-        # Clean up the temporary directory
-        shutil.rmtree(temp_path, ignore_errors=True)
+        # Remove only the generated files so the next example starts clean
+        dev_guidelines_path.unlink(missing_ok=True)
+        llm_guidance_path.unlink(missing_ok=True)
@@ -1,150 +1,172 @@
 """Integration tests for the complete steering wizard workflow."""
 
+import errno
 import os
-import tempfile
 import shutil
+from dataclasses import dataclass
 from pathlib import Path
+from typing import TYPE_CHECKING, Optional
 from unittest.mock import patch, MagicMock
 import pytest
-from click.testing import CliRunner
 
-from steering_wizard.main import main
-from steering_wizard.models.config import ProjectConfiguration, TestingConfig, GitHubConfig, FormattingConfig, VirtualizationConfig
+# The wizard, Click and Rich are imported inside the tests that use them so
+# that collecting or selecting a few tests from this module stays cheap
+if TYPE_CHECKING:
+    from click.testing import CliRunner
 
+    from steering_wizard.models.config import ProjectConfiguration
 
-class TestIntegration:
-    """Integration test cases for end-to-end functionality."""
 
-    def setup_method(self):
-        """Set up test environment for each test."""
-        self.temp_dir = Path(tempfile.mkdtemp())
-        self.runner = CliRunner()
+@pytest.fixture(scope="session")
+def project_template(tmp_path_factory) -> Path:
+    """Build the test project skeleton once per session."""
+    template_dir = tmp_path_factory.mktemp("template")
+    (template_dir / "test_project" / ".kiro").mkdir(parents=True)
+    return template_dir
 
-    def teardown_method(self):
-        """Clean up test environment after each test."""
-        if self.temp_dir.exists():
-            shutil.rmtree(self.temp_dir)
 
-    def create_test_project(self, with_kiro_dir=True):
-        """Create a test project structure."""
-        project_dir = self.temp_dir / "test_project"
-        project_dir.mkdir()
-        
-        if with_kiro_dir:
-            kiro_dir = project_dir / ".kiro"
-            kiro_dir.mkdir()
-            
-        return project_dir
+@pytest.fixture
+def project_dir(project_template: Path, tmp_path: Path) -> Path:
+    """Copy the test project skeleton into a fresh directory for one test."""
+    shutil.copytree(project_template, tmp_path, dirs_exist_ok=True)
+    return tmp_path / "test_project"
+
+
+@pytest.fixture(scope="session")
+def runner() -> "CliRunner":
+    """Provide a CliRunner shared by every test; it keeps no state between invokes."""
+    from click.testing import CliRunner
+
+    return CliRunner()
+
+
+@dataclass
+class QuestionnaireMocks:
+    """Mocks standing in for the interactive prompts of the built-in questionnaire."""
+
+    prompt: MagicMock
+    confirm: MagicMock
+    click_confirm: MagicMock
+
+
+@pytest.fixture
+def mocked_questionnaire(monkeypatch) -> QuestionnaireMocks:
+    """
+    Patch the questionnaire prompts with the default answer sequence.
+
+    Answers pytest and Poetry, no GitHub repository, Black and Google style
+    without custom rules, and declines to show the generated files. Tests
+    override the side effects where they need other answers.
+    """
+    mocks = QuestionnaireMocks(
+        prompt=MagicMock(side_effect=["2", "2"]),
+        confirm=MagicMock(side_effect=[False, False, True, True, False, False]),
+        click_confirm=MagicMock(return_value=False),
+    )
+    monkeypatch.setattr("steering_wizard.core.questionnaire.Prompt.ask", mocks.prompt)
+    monkeypatch.setattr("steering_wizard.core.questionnaire.Confirm.ask", mocks.confirm)
+    monkeypatch.setattr("click.confirm", mocks.click_confirm)
+    return mocks
+
+
+class TestIntegration:
+    """Integration test cases for end-to-end functionality."""
 
-    def test_complete_workflow_with_valid_inputs(self):
+    def test_complete_workflow_with_valid_inputs(self, project_dir, runner, mocked_questionnaire):
         """
         Test complete wizard execution with valid inputs.
         
         Requirements: All requirements integration
         """
-        project_dir = self.create_test_project()
+        from steering_wizard.main import main
+        
+        # Configure mock responses
+        mocked_questionnaire.prompt.side_effect = [
+            "2",  # pytest testing
+            "https://github.com/test/repo",  # GitHub URL
+            "2",  # Poetry virtualization
+        ]
+        
+        mocked_questionnaire.confirm.side_effect = [
+            True,   # Has GitHub repo
+            True,   # Use GitHub Actions
+            True,   # Use Black
+            True,   # Use Google style
+            False,  # No custom rules
+            False,  # No venv docs
+        ]
+        
+        # Run the wizard
+        result = runner.invoke(main, ['--target-dir', str(project_dir)])
+        
+        # Verify successful execution
+        assert result.exit_code == 0
+        assert "Steering documents created successfully" in result.output
         
-        # Mock user inputs for the questionnaire
-        with patch('steering_wizard.core.questionnaire.Prompt.ask') as mock_prompt, \
-             patch('steering_wizard.core.questionnaire.Confirm.ask') as mock_confirm, \
-             patch('click.confirm') as mock_click_confirm:
-            
-            # Configure mock responses
-            mock_prompt.side_effect = [
-                "2",  # pytest testing
-                "https://github.com/test/repo",  # GitHub URL
-                "2",  # Poetry virtualization
-            ]
-            
-            mock_confirm.side_effect = [
-                True,   # Has GitHub repo
-                True,   # Use GitHub Actions
-                True,   # Use Black
-                True,   # Use Google style
-                False,  # No custom rules
-                False,  # No venv docs
-            ]
-            
-            mock_click_confirm.side_effect = [
-                False,  # Don't show file contents
-            ]
-            
-            # Run the wizard
-            result = self.runner.invoke(main, ['--target-dir', str(project_dir)])
-            
-            # Verify successful execution
-            assert result.exit_code == 0
-            assert "Steering documents created successfully" in result.output
-            
-            # Verify files were created
-            steering_dir = project_dir / ".kiro" / "steering"
-            assert steering_dir.exists()
-            assert (steering_dir / "development-guidelines.md").exists()
-            assert (steering_dir / "llm-guidance.md").exists()
-            
-            # Verify file contents contain expected information
-            dev_guidelines = (steering_dir / "development-guidelines.md").read_text()
-            assert "pytest" in dev_guidelines
-            assert "https://github.com/test/repo" in dev_guidelines
-            assert "Poetry" in dev_guidelines
-            
-            llm_guidance = (project_dir / ".kiro" / "steering" / "llm-guidance.md").read_text()
-            assert "**Generated on**:" in llm_guidance
-            assert "pytest" in llm_guidance
+        # Verify files were created
+        steering_dir = project_dir / ".kiro" / "steering"
+        contents = self._read_all(steering_dir)
+        assert contents.keys() == {"development-guidelines.md", "llm-guidance.md"}
+        
+        # Verify file contents contain expected information
+        dev_guidelines = contents["development-guidelines.md"]
+        assert "pytest" in dev_guidelines
+        assert "https://github.com/test/repo" in dev_guidelines
+        assert "Poetry" in dev_guidelines
+        
+        llm_guidance = contents["llm-guidance.md"]
+        assert "**Generated on**:" in llm_guidance
+        assert "pytest" in llm_guidance
 
-    def test_dry_run_mode_functionality(self):
+    def test_dry_run_mode_functionality(self, project_dir, capsys):
         """
         Test dry-run mode functionality.
         
         Requirements: 6.4
         """
-        project_dir = self.create_test_project()
+        from steering_wizard.main import run_wizard
         
-        with patch('steering_wizard.core.questionnaire.Prompt.ask') as mock_prompt, \
-             patch('steering_wizard.core.questionnaire.Confirm.ask') as mock_confirm:
-            
-            # Configure minimal mock responses
-            mock_prompt.side_effect = ["2", "2"]  # pytest, poetry
-            mock_confirm.side_effect = [False, False, True, True, False, False]
-            
-            # Run in dry-run mode
-            result = self.runner.invoke(main, ['--target-dir', str(project_dir), '--dry-run'])
-            
-            # Verify successful execution
-            assert result.exit_code == 0
-            assert "DRY RUN MODE" in result.output
-            assert "Dry run completed successfully" in result.output
-            
-            # Verify no files were actually created
-            steering_dir = project_dir / ".kiro" / "steering"
-            if steering_dir.exists():
-                assert not (steering_dir / "development-guidelines.md").exists()
-                assert not (steering_dir / "llm-guidance.md").exists()
+        config = self._create_test_config(project_dir)
+        
+        # Run in dry-run mode with a pre-built configuration
+        run_wizard(project_dir, dry_run=True, config=config)
+        
+        # Verify successful execution
+        output = capsys.readouterr().out
+        assert "DRY RUN MODE" in output
+        assert "Dry run completed successfully" in output
+        
+        # Verify no files were actually created
+        steering_dir = project_dir / ".kiro" / "steering"
+        if steering_dir.exists():
+            assert not (steering_dir / "development-guidelines.md").exists()
+            assert not (steering_dir / "llm-guidance.md").exists()
 
-    def test_error_recovery_scenarios(self):
+    def test_error_recovery_scenarios(self, tmp_path, runner):
         """
         Test error recovery scenarios.
         
         Requirements: 5.1, 5.2, 5.3
         """
+        from steering_wizard.main import main
+        
         # Test with non-existent target directory
-        non_existent_dir = self.temp_dir / "non_existent"
+        non_existent_dir = tmp_path / "non_existent"
         
-        result = self.runner.invoke(main, ['--target-dir', str(non_existent_dir)])
+        result = runner.invoke(main, ['--target-dir', str(non_existent_dir)])
         
         # Click returns exit code 2 for usage errors
         assert result.exit_code in [1, 2]
         assert "does not exist" in result.output
 
-    def test_file_overwrite_handling(self):
+    def test_file_overwrite_handling(self, project_dir):
         """
         Test file overwrite confirmation handling.
         
         Requirements: 3.4, 4.5, 5.3
         """
-        project_dir = self.create_test_project()
         steering_dir = project_dir / ".kiro" / "steering"
-        steering_dir.mkdir(parents=True)
+        steering_dir.mkdir(parents=True, exist_ok=True)
         
         # Create existing files
         (steering_dir / "development-guidelines.md").write_text("Existing content")
@@ -161,83 +183,77 @@ class TestIntegration:
         assert any(f.name == "development-guidelines.md" for f in existing_files)
         assert any(f.name == "llm-guidance.md" for f in existing_files)
 
-    def test_keyboard_interrupt_handling(self):
+    def test_keyboard_interrupt_handling(self, project_dir, runner):
         """
         Test keyboard interrupt handling and cleanup.
         
         Requirements: 5.3
         """
-        project_dir = self.create_test_project()
+        from steering_wizard.main import main
         
         with patch('steering_wizard.core.questionnaire.QuestionnaireEngine.collect_configuration') as mock_collect:
             # Simulate keyboard interrupt during configuration
             mock_collect.side_effect = KeyboardInterrupt()
             
-            result = self.runner.invoke(main, ['--target-dir', str(project_dir)])
+            result = runner.invoke(main, ['--target-dir', str(project_dir)])
             
             assert result.exit_code == 1
             assert "Wizard interrupted by user" in result.output
 
-    def test_permission_error_handling(self):
+    def test_permission_error_handling(self, project_dir, runner, monkeypatch):
         """
         Test permission error handling.
         
         Requirements: 5.1
         """
-        project_dir = self.create_test_project()
+        from steering_wizard.main import main
         
-        # Make the .kiro directory read-only to simulate permission error
-        kiro_dir = project_dir / ".kiro"
-        os.chmod(kiro_dir, 0o444)  # Read-only
-        
-        try:
-            with patch('steering_wizard.core.questionnaire.Prompt.ask') as mock_prompt, \
-                 patch('steering_wizard.core.questionnaire.Confirm.ask') as mock_confirm:
-                
-                mock_prompt.side_effect = ["2", "2"]
-                mock_confirm.side_effect = [False, False, True, True, False, False]
-                
-                result = self.runner.invoke(main, ['--target-dir', str(project_dir)])
-                
-                assert result.exit_code == 1
-                assert ("Permission" in result.output or "permission" in result.output)
-                
-        finally:
-            # Restore permissions for cleanup
-            os.chmod(kiro_dir, 0o755)
-
-    def test_version_option(self):
-        """
-        Test --version option functionality.
+        # Make creating the steering directory fail as a permission error would,
+        # which chmod cannot simulate when the tests run as root
+        original_mkdir = Path.mkdir
         
-        Requirements: 6.2
-        """
-        result = self.runner.invoke(main, ['--version'])
+        def deny_steering_mkdir(self, *args, **kwargs):
+            if self.name == "steering":
+                raise PermissionError(errno.EACCES, "Permission denied", str(self))
+            return original_mkdir(self, *args, **kwargs)
         
-        assert result.exit_code == 0
-        assert "Steering Docs Wizard" in result.output
-        assert "version" in result.output
+        monkeypatch.setattr(Path, "mkdir", deny_steering_mkdir)
+        
+        result = runner.invoke(main, ['--target-dir', str(project_dir)])
+        
+        assert result.exit_code == 1
+        assert "Permission Error" in result.output
+        assert not (project_dir / ".kiro" / "steering").exists()
 
-    def test_help_option(self):
+    @pytest.mark.parametrize(
+        "flag, expected",
+        [
+            ("--version", ["Steering Docs Wizard", "version"]),
+            ("--help", ["Create standardized steering documents", "--target-dir", "--dry-run"]),
+        ],
+    )
+    def test_informational_options(self, runner, flag, expected):
         """
-        Test --help option functionality.
+        Test the --version and --help options.
         
-        Requirements: 6.1
+        Requirements: 6.1, 6.2
         """
-        result = self.runner.invoke(main, ['--help'])
+        from steering_wizard.main import main
+        
+        result = runner.invoke(main, [flag])
         
         assert result.exit_code == 0
-        assert "Create standardized steering documents" in result.output
-        assert "--target-dir" in result.output
-        assert "--dry-run" in result.output
+        for text in expected:
+            assert text in result.output
 
-    def test_project_discovery_without_kiro_directory(self):
+    def test_project_discovery_without_kiro_directory(self, tmp_path):
         """
         Test project discovery when no .kiro directory exists.
         
         Requirements: 1.1, 1.2, 1.3
         """
-        project_dir = self.create_test_project(with_kiro_dir=False)
+        project_dir = tmp_path / "test_project"
+        project_dir.mkdir()
         
         # Test the project finder directly
         from steering_wizard.core.project_finder import ProjectFinder
@@ -258,74 +274,139 @@ class TestIntegration:
         assert steering_path.name == "steering"
         assert steering_path.parent.name == ".kiro"
 
-    def test_configuration_validation_failure(self):
+    def test_configuration_validation_failure(
+        self, project_dir, runner, mocked_questionnaire, monkeypatch
+    ):
         """
         Test configuration validation failure handling.
         
         Requirements: 2.7, 5.2
         """
-        project_dir = self.create_test_project()
+        from steering_wizard.main import main
         
-        with patch('steering_wizard.core.questionnaire.QuestionnaireEngine.validate_all_responses') as mock_validate:
-            mock_validate.return_value = False
-            
-            with patch('steering_wizard.core.questionnaire.Prompt.ask') as mock_prompt, \
-                 patch('steering_wizard.core.questionnaire.Confirm.ask') as mock_confirm:
-                
-                mock_prompt.side_effect = ["2", "2"]
-                mock_confirm.side_effect = [False, False, True, True, False, False]
-                
-                result = self.runner.invoke(main, ['--target-dir', str(project_dir)])
-                
-                assert result.exit_code == 1
-                assert "Configuration validation failed" in result.output
-
-    def test_file_content_display_option(self):
+        monkeypatch.setattr(
+            "steering_wizard.core.questionnaire.QuestionnaireEngine.validate_all_responses",
+            MagicMock(return_value=False),
+        )
+        
+        result = runner.invoke(main, ['--target-dir', str(project_dir)])
+        
+        assert result.exit_code == 1
+        assert "Configuration validation failed" in result.output
+
+    def test_file_content_display_option(self, project_dir, runner, mocked_questionnaire):
         """
         Test file content display functionality.
         
         Requirements: 5.5
         """
-        project_dir = self.create_test_project()
+        from steering_wizard.main import main
         
-        with patch('steering_wizard.core.questionnaire.Prompt.ask') as mock_prompt, \
-             patch('steering_wizard.core.questionnaire.Confirm.ask') as mock_confirm, \
-             patch('click.confirm') as mock_click_confirm:
-            
-            # Configure mock responses
-            mock_prompt.side_effect = ["2", "2"]
-            mock_confirm.side_effect = [False, False, True, True, False, False]
-            mock_click_confirm.side_effect = [True]  # Show file contents
-            
-            result = self.runner.invoke(main, ['--target-dir', str(project_dir)])
-            
-            assert result.exit_code == 0
-            assert "Contents of development-guidelines.md" in result.output
-            assert "Contents of llm-guidance.md" in result.output
+        mocked_questionnaire.click_confirm.return_value = True  # Show file contents
+        
+        result = runner.invoke(main, ['--target-dir', str(project_dir)])
+        
+        assert result.exit_code == 0
+        assert "Contents of development-guidelines.md" in result.output
+        assert "Contents of llm-guidance.md" in result.output
 
-    def test_custom_formatting_rules_integration(self):
+    def test_custom_formatting_rules_integration(self, project_dir, mocked_questionnaire):
         """
         Test integration with custom formatting rules.
         
         Requirements: 2.5
         """
-        project_dir = self.create_test_project()
+        from steering_wizard.main import run_wizard
         
-        with patch('steering_wizard.core.questionnaire.Prompt.ask') as mock_prompt, \
-             patch('steering_wizard.core.questionnaire.Confirm.ask') as mock_confirm, \
-             patch('steering_wizard.core.questionnaire.QuestionnaireEngine._prompt_custom_formatting_rules') as mock_custom, \
-             patch('click.confirm') as mock_click_confirm:
-            
-            # Configure mock responses
-            mock_prompt.side_effect = ["2", "2"]
-            mock_confirm.side_effect = [False, False, True, True, True, False]  # Include custom rules
-            mock_custom.return_value = "Custom rule: Use 120 character line length"
-            mock_click_confirm.side_effect = [False]
-            
-            result = self.runner.invoke(main, ['--target-dir', str(project_dir)])
-            
-            assert result.exit_code == 0
-            
-            # Verify custom rules are included in the generated file
-            dev_guidelines = (project_dir / ".kiro" / "steering" / "development-guidelines.md").read_text()
-            assert "Custom rule: Use 120 character line length" in dev_guidelines
+        config = self._create_test_config(
+            project_dir, custom_rules="Custom rule: Use 120 character line length"
+        )
+        
+        run_wizard(project_dir, dry_run=False, config=config)
+        
+        # Verify custom rules are included in the generated file
+        contents = self._read_all(project_dir / ".kiro" / "steering")
+        assert "Custom rule: Use 120 character line length" in contents["development-guidelines.md"]
+
+    def test_run_wizard_rejects_config_with_questionnaire(self, project_dir, tmp_path):
+        """Test that a pre-built config cannot be combined with a YAML questionnaire."""
+        from steering_wizard.main import run_wizard
+        
+        config = self._create_test_config(project_dir)
+        
+        with pytest.raises(ValueError):
+            run_wizard(project_dir, dry_run=True, questionnaire_path=tmp_path / "q.yaml", config=config)
+
+    def test_run_wizard_fails_fast_on_broken_template(
+        self, project_dir, tmp_path, mocked_questionnaire, capsys
+    ):
+        """Test that a missing questionnaire template is reported once, without retries."""
+        from steering_wizard.main import run_wizard
+        
+        questionnaire_path = tmp_path / "questionnaire" / "q.yaml"
+        questionnaire_path.parent.mkdir()
+        questionnaire_path.write_text(
+            "metadata: {name: Q, version: '1.0', description: Q}\n"
+            "sections:\n"
+            "  - name: s\n"
+            "    title: S\n"
+            "    questions: [{id: name, type: text, prompt: Name?}]\n"
+            "templates: {guide: missing.j2}\n"
+        )
+        
+        with pytest.raises(SystemExit) as exc_info:
+            run_wizard(project_dir, dry_run=True, questionnaire_path=questionnaire_path)
+        
+        output = capsys.readouterr().out
+        assert exc_info.value.code == 1
+        assert "Template not found: missing.j2" in output
+        assert "Template error" in output
+        assert "Retrying" not in output
+
+    def test_run_wizard_uses_discovered_project_path(
+        self, project_dir, tmp_path, mocked_questionnaire
+    ):
+        """Test that a pre-built config's project path is replaced by the discovered one."""
+        from steering_wizard.main import run_wizard
+        
+        config = self._create_test_config(tmp_path / "elsewhere")
+        
+        run_wizard(project_dir, dry_run=False, config=config)
+        
+        contents = self._read_all(project_dir / ".kiro" / "steering")
+        assert f"**Project Path**: {project_dir}" in contents["llm-guidance.md"]
+
+    def _read_all(self, steering_dir: Path) -> dict[str, str]:
+        """Read every generated steering file once, keyed by file name."""
+        with os.scandir(steering_dir) as entries:
+            return {
+                entry.name: Path(entry.path).read_text()
+                for entry in entries
+                if entry.is_file()
+            }
+
+    def _create_test_config(
+        self, project_path: Path, custom_rules: Optional[str] = None
+    ) -> "ProjectConfiguration":
+        """Create a configuration matching the default questionnaire answers."""
+        from steering_wizard.models.config import (
+            FormattingConfig,
+            GitHubConfig,
+            ProjectConfiguration,
+            TestingConfig,
+            VirtualizationConfig,
+        )
+
+        return ProjectConfiguration.create_with_current_date(
+            testing=TestingConfig(
+                local_testing="pytest", use_docker=False, use_pytest=True
+            ),
+            github=GitHubConfig(repository_url=None, use_github_actions=False),
+            formatting=FormattingConfig(
+                use_black=True, use_google_style=True, custom_rules=custom_rules
+            ),
+            virtualization=VirtualizationConfig(
+                preference="poetry", include_venv_docs=False
+            ),
+            project_path=project_path,
+        )
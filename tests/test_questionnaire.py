@@ -1,12 +1,11 @@
 """Tests for the interactive questionnaire engine."""
 
+import dataclasses
+
 import pytest
-import tempfile
-import shutil
 from pathlib import Path
-from unittest.mock import Mock, patch
-from hypothesis import given, strategies as st, assume
-from rich.console import Console
+from unittest.mock import patch
+from hypothesis import HealthCheck, Phase, given, settings, strategies as st
 
 from steering_wizard.core.questionnaire import QuestionnaireEngine
 from steering_wizard.models.config import (
@@ -17,105 +16,112 @@ from steering_wizard.models.config import (
     ProjectConfiguration,
 )
 
+from .helpers import NullConsole
 
-class TestQuestionnaireEngine:
-    """Test suite for QuestionnaireEngine."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.console = Mock(spec=Console)
-        self.engine = QuestionnaireEngine(console=self.console)
-        self.temp_dir = Path(tempfile.mkdtemp())
+@pytest.fixture
+def console() -> NullConsole:
+    """Provide a console stub; these tests never assert on output."""
+    return NullConsole()
+
+
+@pytest.fixture
+def engine(console: NullConsole) -> QuestionnaireEngine:
+    """Provide a questionnaire engine whose output goes to a NullConsole."""
+    return QuestionnaireEngine(console=console)
+
+
+# Canonical valid sub-configurations; tests derive variants with
+# dataclasses.replace rather than building new instances
+_VALID_TESTING = TestingConfig(
+    local_testing="docker", use_docker=True, use_pytest=False
+)
+_VALID_GITHUB = GitHubConfig(
+    repository_url="https://github.com/user/repo", use_github_actions=True
+)
+_VALID_FORMATTING = FormattingConfig(
+    use_black=True, use_google_style=True, custom_rules=None
+)
+_VALID_VIRTUALIZATION = VirtualizationConfig(
+    preference="poetry", include_venv_docs=True
+)
+
+# Fixed sections shared by the property tests, which only vary the GitHub
+# URL or the custom formatting rules
+_PYTEST_TESTING = TestingConfig(
+    local_testing="pytest", use_docker=False, use_pytest=True
+)
+_NO_GITHUB = GitHubConfig(repository_url=None, use_github_actions=False)
+
+
+@pytest.fixture(scope="module")
+def valid_config(tmp_path_factory) -> ProjectConfiguration:
+    """Build one valid ProjectConfiguration for the whole module."""
+    return ProjectConfiguration.create_with_current_date(
+        testing=_VALID_TESTING,
+        github=_VALID_GITHUB,
+        formatting=_VALID_FORMATTING,
+        virtualization=_VALID_VIRTUALIZATION,
+        project_path=tmp_path_factory.mktemp("valid_config"),
+    )
 
-    def teardown_method(self):
-        """Clean up test fixtures."""
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
 
-    def test_questionnaire_engine_initialization(self):
+class TestQuestionnaireEngine:
+    """Test suite for QuestionnaireEngine."""
+
+    def test_questionnaire_engine_initialization(self, console):
         """Test QuestionnaireEngine initialization."""
         # Test with provided console
-        engine_with_console = QuestionnaireEngine(console=self.console)
-        assert engine_with_console.console == self.console
+        engine_with_console = QuestionnaireEngine(console=console)
+        assert engine_with_console.console == console
 
         # Test with default console
         engine_default = QuestionnaireEngine()
         assert engine_default.console is not None
 
-    def test_validate_all_responses_valid_config(self):
+    def test_validate_all_responses_valid_config(self, engine, valid_config):
         """Test validation with valid configuration."""
-        config = self._create_valid_config()
-        result = self.engine.validate_all_responses(config)
+        result = engine.validate_all_responses(valid_config)
         assert result is True
 
-    def test_validate_all_responses_invalid_config(self):
+    def test_validate_all_responses_invalid_config(self, engine, tmp_path):
         """Test validation with invalid configuration."""
         # Create config with invalid testing preference
-        testing = TestingConfig(
-            local_testing="invalid", use_docker=True, use_pytest=False
-        )
-        github = GitHubConfig(repository_url=None, use_github_actions=False)
-        formatting = FormattingConfig(
-            use_black=True, use_google_style=True, custom_rules=None
-        )
-        virtualization = VirtualizationConfig(
-            preference="poetry", include_venv_docs=True
-        )
-
         config = ProjectConfiguration.create_with_current_date(
-            testing=testing,
-            github=github,
-            formatting=formatting,
-            virtualization=virtualization,
-            project_path=self.temp_dir,
+            testing=dataclasses.replace(_VALID_TESTING, local_testing="invalid"),
+            github=_VALID_GITHUB,
+            formatting=_VALID_FORMATTING,
+            virtualization=_VALID_VIRTUALIZATION,
+            project_path=tmp_path,
         )
 
-        result = self.engine.validate_all_responses(config)
+        result = engine.validate_all_responses(config)
         assert result is False
 
-    def _create_valid_config(self) -> ProjectConfiguration:
-        """Create a valid ProjectConfiguration for testing."""
-        testing = TestingConfig(
-            local_testing="docker", use_docker=True, use_pytest=False
-        )
-        github = GitHubConfig(
-            repository_url="https://github.com/user/repo", use_github_actions=True
-        )
-        formatting = FormattingConfig(
-            use_black=True, use_google_style=True, custom_rules=None
-        )
-        virtualization = VirtualizationConfig(
-            preference="poetry", include_venv_docs=True
-        )
 
-        return ProjectConfiguration.create_with_current_date(
-            testing=testing,
-            github=github,
-            formatting=formatting,
-            virtualization=virtualization,
-            project_path=self.temp_dir,
-        )
-
-
-# Property-based test for Input Validation and Recovery
+# Property-based test for Input Validation and Recovery: invalid URLs
+@settings(
+    max_examples=25,
+    deadline=None,
+    database=None,
+    derandomize=True,
+    suppress_health_check=[HealthCheck.too_slow],
+    phases=(Phase.explicit, Phase.generate),
+)
 @given(
-    invalid_urls=st.one_of(
-        st.text(min_size=1, max_size=50).filter(
-            lambda x: not x.startswith("https://github.com/")
+    invalid_url=st.one_of(
+        # Prefix rather than filter so no draw is rejected
+        st.text(min_size=1, max_size=50).map(
+            lambda x: "X" + x if x.startswith("https://github.com/") else x
         ),
         st.just("not-a-url"),
         st.just("http://github.com/user/repo"),  # Wrong protocol
         st.just("https://gitlab.com/user/repo"),  # Wrong domain
         st.just("https://github.com/"),  # Missing user/repo
         st.just("https://github.com/user"),  # Missing repo
-    ),
-    valid_urls=st.one_of(
-        st.just("https://github.com/user/repo"),
-        st.just("https://github.com/test-user/test-repo"),
-        st.just("https://github.com/user123/repo-name"),
-        st.just("https://github.com/user/repo/"),  # With trailing slash
-    ),
+    )
 )
-def test_input_validation_and_recovery(invalid_urls, valid_urls):
+def test_invalid_github_urls_reject(invalid_url):
     """
     Property 2: Input Validation and Recovery
 
@@ -126,54 +132,109 @@ def test_input_validation_and_recovery(invalid_urls, valid_urls):
     **Feature: steering-docs-wizard, Property 2: Input Validation and Recovery**
     **Validates: Requirements 2.2, 2.6, 5.2**
     """
-    import re
-
-    # Test GitHub URL validation pattern
-    github_pattern = r"^https://github\.com/[a-zA-Z0-9_.-]+/[a-zA-Z0-9_.-]+/?$"
-
-    # Invalid URLs should not match the pattern
-    assert not re.match(
-        github_pattern, invalid_urls
-    ), f"Invalid URL {invalid_urls} should not match pattern"
-
-    # Valid URLs should match the pattern
-    assert re.match(
-        github_pattern, valid_urls
-    ), f"Valid URL {valid_urls} should match pattern"
-
-    # Test GitHubConfig validation
-    invalid_config = GitHubConfig(repository_url=invalid_urls, use_github_actions=True)
+    invalid_config = GitHubConfig(repository_url=invalid_url, use_github_actions=True)
     assert (
         not invalid_config.validate()
-    ), f"GitHubConfig with invalid URL {invalid_urls} should not validate"
+    ), f"GitHubConfig with invalid URL {invalid_url} should not validate"
+
+
+# The accepted URL shapes are a fixed list, so they are enumerated directly
+@pytest.mark.fast
+@pytest.mark.parametrize(
+    "valid_url",
+    [
+        "https://github.com/user/repo",
+        "https://github.com/test-user/test-repo",
+        "https://github.com/user123/repo-name",
+        "https://github.com/user/repo/",  # With trailing slash
+    ],
+)
+def test_valid_github_urls_accept(valid_url):
+    """
+    Property 2: Input Validation and Recovery (accepted URLs)
 
-    valid_config = GitHubConfig(repository_url=valid_urls, use_github_actions=True)
+    **Feature: steering-docs-wizard, Property 2: Input Validation and Recovery**
+    **Validates: Requirements 2.2, 2.6, 5.2**
+    """
+    valid_config = GitHubConfig(repository_url=valid_url, use_github_actions=True)
     assert (
         valid_config.validate()
-    ), f"GitHubConfig with valid URL {valid_urls} should validate"
+    ), f"GitHubConfig with valid URL {valid_url} should validate"
+
+
+@pytest.mark.fast
+def test_github_disabled_config_is_valid():
+    """Test that a GitHubConfig without a repository URL validates (optional field)."""
+    assert _NO_GITHUB.validate(), "GitHubConfig with None URL should always validate"
+
+
+# Text drawn from letter, digit and punctuation categories; custom rules
+# draws are capped at 200 characters since longer strings add no signal
+_UNICODE_TEXT = st.text(
+    alphabet=st.characters(
+        whitelist_categories=("Lu", "Ll", "Nd", "Pc", "Pd", "Ps", "Pe", "Po")
+    ),
+    max_size=200,
+)
+
+
+@st.composite
+def _multiline_text(draw):
+    """Draw text that always contains a newline, without filtering draws."""
+    lines = draw(st.lists(st.text(max_size=45), min_size=2, max_size=4))
+    return "\n".join(lines)
+
 
-    # Test that None URLs are always valid (optional field)
-    none_config = GitHubConfig(repository_url=None, use_github_actions=False)
-    assert none_config.validate(), "GitHubConfig with None URL should always validate"
+# The custom input property only varies the formatting section, so the
+# other sections' validity is checked once here rather than on every example
+_CUSTOM_INPUT_OTHERS_VALID = (
+    _PYTEST_TESTING.validate()
+    and _NO_GITHUB.validate()
+    and _VALID_VIRTUALIZATION.validate()
+)
+
+
+@pytest.fixture(scope="module")
+def custom_input_dir(tmp_path_factory) -> Path:
+    """Provide one project directory shared by every custom input example."""
+    return tmp_path_factory.mktemp("custom_input")
+
+
+@pytest.fixture(scope="module")
+def custom_input_base(custom_input_dir) -> ProjectConfiguration:
+    """Build the project configuration each custom input example varies."""
+    return ProjectConfiguration.create_with_current_date(
+        testing=_PYTEST_TESTING,
+        github=_NO_GITHUB,
+        formatting=FormattingConfig(
+            use_black=True, use_google_style=True, custom_rules=None
+        ),
+        virtualization=_VALID_VIRTUALIZATION,
+        project_path=custom_input_dir,
+    )
 
 
 # Property-based test for Custom Input Handling
+@settings(
+    max_examples=25,
+    deadline=None,
+    database=None,
+    derandomize=True,
+    suppress_health_check=[HealthCheck.too_slow],
+    phases=(Phase.explicit, Phase.generate),
+)
 @given(
     custom_rules=st.one_of(
         st.none(),
-        st.text(),
-        st.text(min_size=1, max_size=1000),
-        st.text().filter(lambda x: "\n" in x),  # Multi-line text
+        st.text(max_size=200),
+        st.text(min_size=1, max_size=200),
+        _multiline_text(),  # Multi-line text
         st.just(""),  # Empty string
         st.just("   "),  # Whitespace only
-        st.text(
-            alphabet=st.characters(
-                whitelist_categories=("Lu", "Ll", "Nd", "Pc", "Pd", "Ps", "Pe", "Po")
-            )
-        ),  # Various characters
+        _UNICODE_TEXT,  # Various characters
     )
 )
-def test_custom_input_handling(custom_rules):
+def test_custom_input_handling(custom_input_base, custom_rules):
     """
     Property 7: Custom Input Handling
 
@@ -199,89 +260,57 @@ def test_custom_input_handling(custom_rules):
         config.custom_rules == custom_rules
     ), f"Custom rules should be preserved exactly: expected {repr(custom_rules)}, got {repr(config.custom_rules)}"
 
-    # Test that the configuration can be created and used in ProjectConfiguration
-    temp_path = Path(tempfile.mkdtemp())
-    try:
-        testing = TestingConfig(
-            local_testing="pytest", use_docker=False, use_pytest=True
-        )
-        github = GitHubConfig(repository_url=None, use_github_actions=False)
-        virtualization = VirtualizationConfig(
-            preference="poetry", include_venv_docs=True
-        )
+    # Test that the configuration can be used in ProjectConfiguration; only
+    # the formatting section varies between examples
+    project_config = dataclasses.replace(custom_input_base, formatting=config)
 
-        project_config = ProjectConfiguration.create_with_current_date(
-            testing=testing,
-            github=github,
-            formatting=config,
-            virtualization=virtualization,
-            project_path=temp_path,
-        )
+    # The custom rules should still be preserved in the complete configuration
+    assert (
+        project_config.formatting.custom_rules == custom_rules
+    ), "Custom rules should be preserved in ProjectConfiguration"
 
-        # The custom rules should still be preserved in the complete configuration
+    # The project configuration should be valid when all components are valid;
+    # the formatting section was already asserted valid above
+    if _CUSTOM_INPUT_OTHERS_VALID:
         assert (
-            project_config.formatting.custom_rules == custom_rules
-        ), "Custom rules should be preserved in ProjectConfiguration"
-
-        # The project configuration should be valid when all components are valid
-        if (
-            testing.validate()
-            and github.validate()
-            and config.validate()
-            and virtualization.validate()
-        ):
-            assert (
-                project_config.validate()
-            ), "ProjectConfiguration should be valid when all components are valid"
-
-    finally:
-        # Clean up
-        shutil.rmtree(temp_path, ignore_errors=True)
+            project_config.validate()
+        ), "ProjectConfiguration should be valid when all components are valid"
 
 
 # Additional unit tests for specific validation scenarios
+@pytest.mark.fast
 class TestInputValidationScenarios:
     """Test specific input validation scenarios."""
 
-    def test_testing_config_validation_scenarios(self):
+    @pytest.mark.parametrize(
+        "config,expected",
+        [
+            # Valid scenarios
+            (TestingConfig("docker", True, False), True),
+            (TestingConfig("pytest", False, True), True),
+            (TestingConfig("both", True, True), True),
+            (TestingConfig("none", False, False), True),
+            # Invalid scenarios
+            (TestingConfig("invalid", True, False), False),
+            (TestingConfig("", True, False), False),
+        ],
+    )
+    def test_testing_config_validation_scenarios(self, config, expected):
         """Test various TestingConfig validation scenarios."""
-        # Valid scenarios
-        valid_configs = [
-            TestingConfig("docker", True, False),
-            TestingConfig("pytest", False, True),
-            TestingConfig("both", True, True),
-            TestingConfig("none", False, False),
-        ]
-
-        for config in valid_configs:
-            assert config.validate(), f"Config should be valid: {config}"
-
-        # Invalid scenarios
-        invalid_configs = [
-            TestingConfig("invalid", True, False),
-            TestingConfig("", True, False),
-        ]
-
-        for config in invalid_configs:
-            assert not config.validate(), f"Config should be invalid: {config}"
-
-    def test_virtualization_config_validation_scenarios(self):
+        assert config.validate() is expected, f"Unexpected validation result: {config}"
+
+    @pytest.mark.parametrize(
+        "config,expected",
+        [
+            # Valid scenarios
+            (VirtualizationConfig("venv", True), True),
+            (VirtualizationConfig("poetry", False), True),
+            (VirtualizationConfig("poetry_with_venv_docs", True), True),
+            # Invalid scenarios
+            (VirtualizationConfig("invalid", True), False),
+            (VirtualizationConfig("", True), False),
+        ],
+    )
+    def test_virtualization_config_validation_scenarios(self, config, expected):
         """Test various VirtualizationConfig validation scenarios."""
-        # Valid scenarios
-        valid_configs = [
-            VirtualizationConfig("venv", True),
-            VirtualizationConfig("poetry", False),
-            VirtualizationConfig("poetry_with_venv_docs", True),
-        ]
-
-        for config in valid_configs:
-            assert config.validate(), f"Config should be valid: {config}"
-
-        # Invalid scenarios
-        invalid_configs = [
-            VirtualizationConfig("invalid", True),
-            VirtualizationConfig("", True),
-        ]
-
-        for config in invalid_configs:
-            assert not config.validate(), f"Config should be invalid: {config}"
+        assert config.validate() is expected, f"Unexpected validation result: {config}"
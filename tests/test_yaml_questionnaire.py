@@ -1,14 +1,15 @@
 """Tests for YAML questionnaire system components."""
 
+import io
+import jsonschema
 import pytest
 from pathlib import Path
-from unittest.mock import Mock, patch, mock_open
 from typing import Dict, Any
 import tempfile
 import yaml
 
 from steering_wizard.core.yaml_questionnaire import YamlQuestionnaireLoader, YamlQuestionnaireError
-from steering_wizard.core.dynamic_questionnaire import DynamicQuestionnaireEngine
+from steering_wizard.core.dynamic_questionnaire import Confirm, DynamicQuestionnaireEngine, Prompt
 from steering_wizard.core.template_engine import TemplateEngine, TemplateEngineError
 from steering_wizard.models.questionnaire_schema import (
     QuestionnaireSchema, QuestionnaireMetadata, Section, Question, 
@@ -16,21 +17,107 @@ from steering_wizard.models.questionnaire_schema import (
 )
 
 
+def _single_question_schema(question: Question) -> QuestionnaireSchema:
+    """Wrap one question in a single-section schema."""
+    section = Section(name="test", title="Test", questions=[question])
+    return QuestionnaireSchema(
+        metadata=QuestionnaireMetadata(name="Test", version="1.0", description="Test"),
+        sections=[section]
+    )
+
+
+# Schemas below are shared read-only across the module; no test mutates them
+@pytest.fixture(scope="module")
+def boolean_schema() -> QuestionnaireSchema:
+    """Schema with a single boolean question."""
+    return _single_question_schema(Question(
+        id="test_bool",
+        type=QuestionType.BOOLEAN,
+        prompt="Test boolean question?"
+    ))
+
+
+@pytest.fixture(scope="module")
+def choice_schema() -> QuestionnaireSchema:
+    """Schema with a single two-option choice question."""
+    return _single_question_schema(Question(
+        id="test_choice",
+        type=QuestionType.CHOICE,
+        prompt="Test choice question?",
+        choices=[
+            Choice(value="option1", label="Option 1"),
+            Choice(value="option2", label="Option 2")
+        ]
+    ))
+
+
+@pytest.fixture(scope="module")
+def text_validation_schema() -> QuestionnaireSchema:
+    """Schema with a single text question whose answer must start with 'test'."""
+    return _single_question_schema(Question(
+        id="test_text",
+        type=QuestionType.TEXT,
+        prompt="Test text question?",
+        validation=ValidationRule(regex=r"^test.*", required=True)
+    ))
+
+
+@pytest.fixture(scope="module")
+def conditional_question() -> Question:
+    """Text question shown only when use_feature is true."""
+    return Question(
+        id="conditional_q",
+        type=QuestionType.TEXT,
+        prompt="Conditional question?",
+        condition="use_feature == true"
+    )
+
+
+@pytest.fixture(scope="module")
+def template_dir(tmp_path_factory) -> Path:
+    """Create the shared read-only template set once for the module."""
+    directory = tmp_path_factory.mktemp("templates")
+    templates = {
+        "test.j2": "Hello {{ name }}!",
+        "greeting.j2": "Hello {{ answers.name }}! Project: {{ project_path }}",
+        "content.j2": "Content: {{ answers.content }}",
+        "template1.j2": "Template 1",
+        "template2.j2": "Template 2",
+        "not_template.txt": "Not a template",
+        "dev-guidelines.j2": "Project: {{ answers.project_name }}\nTesting: {{ answers.use_testing }}",
+        "llm-guidance.j2": "Framework: {{ answers.testing_framework if answers.use_testing else 'None' }}",
+    }
+    for name, content in templates.items():
+        (directory / name).write_text(content)
+    return directory
+
+
+@pytest.fixture(scope="module")
+def empty_schema() -> QuestionnaireSchema:
+    """Schema with metadata only, for rendering tests."""
+    return QuestionnaireSchema(
+        metadata=QuestionnaireMetadata(name="Test", version="1.0", description="Test"),
+        sections=[]
+    )
+
+
 class TestYamlQuestionnaireLoader:
     """Test YAML questionnaire loading and validation."""
     
-    def test_loader_initialization(self):
+    def test_loader_initialization(self, null_console):
         """Test YamlQuestionnaireLoader initialization."""
-        console = Mock()
-        loader = YamlQuestionnaireLoader(console)
-        assert loader.console == console
+        loader = YamlQuestionnaireLoader(null_console)
+        assert loader.console == null_console
+    
+    def test_yaml_schema_is_valid_json_schema(self):
+        """Test that the built-in questionnaire schema is itself a valid JSON Schema."""
+        schema = YamlQuestionnaireLoader.YAML_SCHEMA
+        jsonschema.validators.validator_for(schema).check_schema(schema)
     
-    def test_load_valid_questionnaire(self):
+    def test_load_valid_questionnaire(self, null_console):
         """Test loading a valid questionnaire YAML file."""
-        console = Mock()
-        loader = YamlQuestionnaireLoader(console)
+        loader = YamlQuestionnaireLoader(null_console)
         
-        # Create a temporary YAML file
         yaml_content = """
 metadata:
   name: "Test Questionnaire"
@@ -56,27 +143,18 @@ templates:
   llm_guidance: "llm-template.j2"
 """
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            f.write(yaml_content)
-            temp_path = Path(f.name)
+        schema = loader.load_from_string(yaml_content)
         
-        try:
-            schema = loader.load_from_file(temp_path)
-            
-            assert isinstance(schema, QuestionnaireSchema)
-            assert schema.metadata.name == "Test Questionnaire"
-            assert schema.metadata.version == "1.0"
-            assert len(schema.sections) == 1
-            assert len(schema.sections[0].questions) == 1
-            assert schema.templates["development_guidelines"] == "dev-template.j2"
-            
-        finally:
-            temp_path.unlink()
+        assert isinstance(schema, QuestionnaireSchema)
+        assert schema.metadata.name == "Test Questionnaire"
+        assert schema.metadata.version == "1.0"
+        assert len(schema.sections) == 1
+        assert len(schema.sections[0].questions) == 1
+        assert schema.templates["development_guidelines"] == "dev-template.j2"
     
-    def test_load_invalid_yaml_file(self):
+    def test_load_invalid_yaml_file(self, null_console):
         """Test loading an invalid YAML file."""
-        console = Mock()
-        loader = YamlQuestionnaireLoader(console)
+        loader = YamlQuestionnaireLoader(null_console)
         
         # Create invalid YAML
         invalid_yaml = "invalid: yaml: content: ["
@@ -91,10 +169,16 @@ templates:
         finally:
             temp_path.unlink()
     
-    def test_validate_questionnaire_file_valid(self):
+    def test_load_invalid_yaml_string(self, null_console):
+        """Test loading invalid YAML text."""
+        loader = YamlQuestionnaireLoader(null_console)
+        
+        with pytest.raises(YamlQuestionnaireError, match="Invalid YAML syntax"):
+            loader.load_from_string("invalid: yaml: content: [")
+    
+    def test_validate_questionnaire_file_valid(self, null_console):
         """Test validation of a valid questionnaire file."""
-        console = Mock()
-        loader = YamlQuestionnaireLoader(console)
+        loader = YamlQuestionnaireLoader(null_console)
         
         yaml_content = """
 metadata:
@@ -125,10 +209,9 @@ templates:
         finally:
             temp_path.unlink()
     
-    def test_validate_questionnaire_file_invalid(self):
+    def test_validate_questionnaire_file_invalid(self, null_console):
         """Test validation of an invalid questionnaire file."""
-        console = Mock()
-        loader = YamlQuestionnaireLoader(console)
+        loader = YamlQuestionnaireLoader(null_console)
         
         # Missing required fields
         yaml_content = """
@@ -150,21 +233,72 @@ templates: {}
             assert len(errors) > 0
         finally:
             temp_path.unlink()
+    
+    def test_load_from_file_reuses_schema_for_same_content(self, tmp_path, null_console):
+        """Test that files with identical content share one parsed schema."""
+        loader = YamlQuestionnaireLoader(null_console)
+        
+        yaml_content = """
+metadata:
+  name: "Cached Questionnaire"
+  version: "1.0"
+  description: "Cache test"
+
+sections:
+  - name: "section"
+    title: "Section"
+    questions:
+      - id: "name"
+        type: "text"
+        prompt: "Name?"
+"""
+        first_path = tmp_path / "first.yaml"
+        second_path = tmp_path / "second.yaml"
+        first_path.write_text(yaml_content)
+        second_path.write_text(yaml_content)
+        
+        first = loader.load_from_file(first_path)
+        assert loader.load_from_file(second_path) is first
+        
+        # Changed content is parsed again
+        second_path.write_text(yaml_content.replace("1.0", "2.0"))
+        changed = loader.load_from_file(second_path)
+        assert changed is not first
+        assert changed.metadata.version == "2.0"
+    
+    def test_load_invalid_validation_regex(self, null_console):
+        """Test that a malformed validation regex is rejected at load time."""
+        loader = YamlQuestionnaireLoader(null_console)
+        
+        yaml_data = {
+            "metadata": {"name": "Regex", "version": "1.0", "description": "Bad regex"},
+            "sections": [{
+                "name": "section",
+                "title": "Section",
+                "questions": [{
+                    "id": "repo",
+                    "type": "text",
+                    "prompt": "Repository?",
+                    "validation": {"regex": "^(unclosed"}
+                }]
+            }]
+        }
+        
+        with pytest.raises(YamlQuestionnaireError, match="Invalid regex for question 'repo'"):
+            loader.load_from_dict(yaml_data)
 
 
 class TestDynamicQuestionnaireEngine:
     """Test dynamic questionnaire processing."""
     
-    def test_engine_initialization(self):
+    def test_engine_initialization(self, null_console):
         """Test DynamicQuestionnaireEngine initialization."""
-        console = Mock()
-        engine = DynamicQuestionnaireEngine(console)
-        assert engine.console == console
+        engine = DynamicQuestionnaireEngine(null_console)
+        assert engine.console == null_console
     
-    def test_load_questionnaire_success(self):
+    def test_load_questionnaire_success(self, null_console):
         """Test successful questionnaire loading."""
-        console = Mock()
-        engine = DynamicQuestionnaireEngine(console)
+        engine = DynamicQuestionnaireEngine(null_console)
         
         yaml_content = """
 metadata:
@@ -195,290 +329,240 @@ templates:
         finally:
             temp_path.unlink()
     
-    @patch('steering_wizard.core.dynamic_questionnaire.Confirm.ask')
-    def test_collect_answers_boolean_question(self, mock_confirm):
+    def test_collect_answers_boolean_question(self, monkeypatch, boolean_schema, null_console):
         """Test collecting answers for boolean questions."""
-        mock_confirm.return_value = True
+        prompts = []
+        monkeypatch.setattr(Confirm, "ask", lambda *args, **kwargs: prompts.append(args) or True)
         
-        console = Mock()
-        engine = DynamicQuestionnaireEngine(console)
-        
-        # Create a simple schema with boolean question
-        question = Question(
-            id="test_bool",
-            type=QuestionType.BOOLEAN,
-            prompt="Test boolean question?"
-        )
-        section = Section(name="test", title="Test", questions=[question])
-        schema = QuestionnaireSchema(
-            metadata=QuestionnaireMetadata(name="Test", version="1.0", description="Test"),
-            sections=[section]
-        )
+        engine = DynamicQuestionnaireEngine(null_console)
         
-        answers = engine.collect_answers(schema, Path("/test/path"))
+        answers = engine.collect_answers(boolean_schema, Path("/test/path"))
         
         assert answers["test_bool"] is True
-        mock_confirm.assert_called_once()
+        assert len(prompts) == 1
     
-    @patch('steering_wizard.core.dynamic_questionnaire.Prompt.ask')
-    def test_collect_answers_choice_question(self, mock_prompt):
+    def test_collect_answers_choice_question(self, monkeypatch, choice_schema, null_console):
         """Test collecting answers for choice questions."""
-        mock_prompt.return_value = "1"
-        
-        console = Mock()
-        engine = DynamicQuestionnaireEngine(console)
+        prompts = []
+        monkeypatch.setattr(Prompt, "ask", lambda *args, **kwargs: prompts.append(args) or "1")
         
-        # Create a choice question
-        choices = [
-            Choice(value="option1", label="Option 1"),
-            Choice(value="option2", label="Option 2")
-        ]
-        question = Question(
-            id="test_choice",
-            type=QuestionType.CHOICE,
-            prompt="Test choice question?",
-            choices=choices
-        )
-        section = Section(name="test", title="Test", questions=[question])
-        schema = QuestionnaireSchema(
-            metadata=QuestionnaireMetadata(name="Test", version="1.0", description="Test"),
-            sections=[section]
-        )
+        engine = DynamicQuestionnaireEngine(null_console)
         
-        answers = engine.collect_answers(schema, Path("/test/path"))
+        answers = engine.collect_answers(choice_schema, Path("/test/path"))
         
         assert answers["test_choice"] == "option1"
-        mock_prompt.assert_called_once()
+        assert len(prompts) == 1
     
-    def test_validate_answers_success(self):
-        """Test successful answer validation."""
-        console = Mock()
-        engine = DynamicQuestionnaireEngine(console)
+    def test_collect_answers_override_skips_prompts(self, monkeypatch, null_console):
+        """Test that supplied answers are used without prompting."""
+        def fail_prompt(*args, **kwargs):
+            raise AssertionError("prompted in non-interactive mode")
+        monkeypatch.setattr(Confirm, "ask", fail_prompt)
+        monkeypatch.setattr(Prompt, "ask", fail_prompt)
         
-        # Create schema with validation
-        validation = ValidationRule(regex=r"^test.*", required=True)
-        question = Question(
-            id="test_text",
-            type=QuestionType.TEXT,
-            prompt="Test text question?",
-            validation=validation
-        )
-        section = Section(name="test", title="Test", questions=[question])
         schema = QuestionnaireSchema(
             metadata=QuestionnaireMetadata(name="Test", version="1.0", description="Test"),
-            sections=[section]
+            sections=[Section(name="test", title="Test", questions=[
+                Question(id="use_feature", type=QuestionType.BOOLEAN, prompt="Use feature?"),
+                Question(
+                    id="feature_name",
+                    type=QuestionType.TEXT,
+                    prompt="Feature name?",
+                    condition="use_feature == true"
+                ),
+            ])]
+        )
+        engine = DynamicQuestionnaireEngine(null_console)
+        
+        answers = engine.collect_answers(
+            schema, Path("/test/path"), answers_override={"use_feature": True, "feature_name": "x"}
         )
+        assert answers == {"use_feature": True, "feature_name": "x"}
+        
+        # Answers to questions whose condition fails are dropped
+        answers = engine.collect_answers(
+            schema, Path("/test/path"), answers_override={"use_feature": False, "feature_name": "x"}
+        )
+        assert answers == {"use_feature": False}
+    
+    def test_collect_answers_override_invalid(self, text_validation_schema, null_console):
+        """Test that supplied answers failing validation are rejected."""
+        engine = DynamicQuestionnaireEngine(null_console)
+        
+        with pytest.raises(YamlQuestionnaireError):
+            engine.collect_answers(
+                text_validation_schema, Path("/test/path"), answers_override={"test_text": "invalid_value"}
+            )
+    
+    def test_validate_answers_success(self, text_validation_schema, null_console):
+        """Test successful answer validation."""
+        engine = DynamicQuestionnaireEngine(null_console)
         
         answers = {"test_text": "test_value"}
         
-        is_valid = engine.validate_answers(answers, schema)
+        is_valid = engine.validate_answers(answers, text_validation_schema)
         assert is_valid
     
-    def test_validate_answers_failure(self):
+    def test_validate_answers_failure(self, text_validation_schema, null_console):
         """Test answer validation failure."""
-        console = Mock()
-        engine = DynamicQuestionnaireEngine(console)
-        
-        # Create schema with validation that will fail
-        validation = ValidationRule(regex=r"^test.*", required=True)
-        question = Question(
-            id="test_text",
-            type=QuestionType.TEXT,
-            prompt="Test text question?",
-            validation=validation
-        )
-        section = Section(name="test", title="Test", questions=[question])
-        schema = QuestionnaireSchema(
-            metadata=QuestionnaireMetadata(name="Test", version="1.0", description="Test"),
-            sections=[section]
-        )
+        engine = DynamicQuestionnaireEngine(null_console)
         
         answers = {"test_text": "invalid_value"}  # Doesn't match regex
         
-        is_valid = engine.validate_answers(answers, schema)
+        is_valid = engine.validate_answers(answers, text_validation_schema)
         assert not is_valid
 
 
 class TestTemplateEngine:
     """Test template engine functionality."""
     
-    def test_engine_initialization(self):
+    def test_engine_initialization(self, null_console):
         """Test TemplateEngine initialization."""
-        console = Mock()
-        engine = TemplateEngine(console)
-        assert engine.console == console
+        engine = TemplateEngine(null_console)
+        assert engine.console == null_console
     
-    def test_setup_environment_success(self):
+    def test_setup_environment_success(self, template_dir, null_console):
         """Test successful template environment setup."""
-        console = Mock()
-        engine = TemplateEngine(console)
-        
-        # Create temporary template directory
-        with tempfile.TemporaryDirectory() as temp_dir:
-            template_dirs = [Path(temp_dir)]
-            
-            # Create a test template
-            template_path = Path(temp_dir) / "test.j2"
-            template_path.write_text("Hello {{ name }}!")
-            
-            engine.setup_environment(template_dirs)
-            
-            # Verify environment is set up
-            assert engine.env is not None
-    
-    def test_render_template_success(self):
-        """Test successful template rendering."""
-        console = Mock()
-        engine = TemplateEngine(console)
-        
-        with tempfile.TemporaryDirectory() as temp_dir:
-            template_dirs = [Path(temp_dir)]
-            
-            # Create a test template
-            template_path = Path(temp_dir) / "test.j2"
-            template_path.write_text("Hello {{ answers.name }}! Project: {{ project_path }}")
-            
-            engine.setup_environment(template_dirs)
-            
-            context = {"name": "World"}
-            project_path = Path("/test/project")
-            
-            # Create a mock schema
-            schema = QuestionnaireSchema(
-                metadata=QuestionnaireMetadata(name="Test", version="1.0", description="Test"),
-                sections=[]
-            )
-            
-            result = engine.render_template("test.j2", context, schema, project_path)
-            
-            assert "Hello World!" in result
-            assert "Project: /test/project" in result
+        engine = TemplateEngine(null_console)
+        
+        engine.setup_environment([template_dir])
+        
+        # Verify environment is set up
+        assert engine.env is not None
     
-    def test_render_template_not_found(self):
-        """Test template rendering with missing template."""
-        console = Mock()
-        engine = TemplateEngine(console)
-        
-        with tempfile.TemporaryDirectory() as temp_dir:
-            template_dirs = [Path(temp_dir)]
-            engine.setup_environment(template_dirs)
-            
-            # Create a mock schema
-            schema = QuestionnaireSchema(
-                metadata=QuestionnaireMetadata(name="Test", version="1.0", description="Test"),
-                sections=[]
-            )
-            
-            with pytest.raises(TemplateEngineError, match="Template not found"):
-                engine.render_template("nonexistent.j2", {}, schema, Path("/test"))
+    def test_setup_environment_reuses_environment(self, tmp_path, null_console):
+        """Test that engines set up with the same directories share an environment."""
+        (tmp_path / "test.j2").write_text("Hello {{ name }}!")
+        
+        first = TemplateEngine(null_console)
+        first.setup_environment([tmp_path])
+        second = TemplateEngine(null_console)
+        second.setup_environment([tmp_path])
+        
+        assert second.env is first.env
+        assert not first.env.auto_reload
     
-    def test_render_to_file_success(self):
-        """Test successful template rendering to file."""
-        console = Mock()
-        engine = TemplateEngine(console)
-        
-        with tempfile.TemporaryDirectory() as temp_dir:
-            template_dirs = [Path(temp_dir)]
-            
-            # Create a test template
-            template_path = Path(temp_dir) / "test.j2"
-            template_path.write_text("Content: {{ answers.content }}")
-            
-            engine.setup_environment(template_dirs)
-            
-            # Render to output file
-            output_path = Path(temp_dir) / "output.txt"
-            context = {"content": "test content"}
-            
-            # Create a mock schema
-            schema = QuestionnaireSchema(
-                metadata=QuestionnaireMetadata(name="Test", version="1.0", description="Test"),
-                sections=[]
-            )
-            
-            engine.render_to_file("test.j2", output_path, context, schema, Path("/test"))
-            
-            assert output_path.exists()
-            assert "Content: test content" in output_path.read_text()
+    def test_setup_environment_without_bytecode_cache(self, tmp_path, monkeypatch, null_console):
+        """Test that an unusable bytecode cache directory does not stop setup."""
+        def unusable_cache():
+            raise RuntimeError("unsafe cache directory")
+        monkeypatch.setattr("jinja2.FileSystemBytecodeCache", unusable_cache)
+        (tmp_path / "test.j2").write_text("Hello {{ name }}!")
+        
+        engine = TemplateEngine(null_console)
+        engine.setup_environment([tmp_path])
+        
+        assert engine.env.bytecode_cache is None
+        assert engine.env.get_template("test.j2").render(name="World") == "Hello World!"
     
-    def test_list_available_templates(self):
-        """Test listing available templates."""
-        console = Mock()
-        engine = TemplateEngine(console)
-        
-        with tempfile.TemporaryDirectory() as temp_dir:
-            template_dirs = [Path(temp_dir)]
-            
-            # Create test templates
-            (Path(temp_dir) / "template1.j2").write_text("Template 1")
-            (Path(temp_dir) / "template2.j2").write_text("Template 2")
-            (Path(temp_dir) / "not_template.txt").write_text("Not a template")
-            
-            templates = engine.list_available_templates(template_dirs)
-            
-            assert "template1.j2" in templates
-            assert "template2.j2" in templates
-            assert "not_template.txt" not in templates
-
-
-class TestQuestionnaireSchemaValidation:
-    """Test questionnaire schema validation logic."""
+    def test_render_template_success(self, template_dir, empty_schema, null_console):
+        """Test successful template rendering."""
+        engine = TemplateEngine(null_console)
+        engine.setup_environment([template_dir])
+        
+        context = {"name": "World"}
+        project_path = Path("/test/project")
+        
+        result = engine.render_template("greeting.j2", context, empty_schema, project_path)
+        
+        assert "Hello World!" in result
+        assert "Project: /test/project" in result
     
-    def test_validation_rule_required_field(self):
-        """Test validation rule for required fields."""
-        rule = ValidationRule(required=True)
+    def test_render_template_not_found(self, template_dir, empty_schema, null_console):
+        """Test template rendering with missing template."""
+        engine = TemplateEngine(null_console)
+        engine.setup_environment([template_dir])
         
-        # Test empty value
-        is_valid, error = rule.validate("")
-        assert not is_valid
-        assert "required" in error.lower()
+        with pytest.raises(TemplateEngineError, match="Template not found"):
+            engine.render_template("nonexistent.j2", {}, empty_schema, Path("/test"))
+    
+    def test_preload_missing_template(self, template_dir, empty_schema, null_console):
+        """Test that preloading reports a missing template before rendering."""
+        engine = TemplateEngine(null_console)
+        engine.setup_environment([template_dir])
+        schema = QuestionnaireSchema(
+            metadata=empty_schema.metadata,
+            templates={"guide": "test.j2", "missing": "nonexistent.j2"}
+        )
         
-        # Test valid value
-        is_valid, error = rule.validate("test")
-        assert is_valid
-        assert error is None
+        with pytest.raises(TemplateEngineError, match="Template not found: nonexistent.j2"):
+            engine.preload(schema)
     
-    def test_validation_rule_regex(self):
-        """Test validation rule with regex."""
-        rule = ValidationRule(regex=r"^[a-z]+$", error_message="Only lowercase letters")
+    def test_render_to_file_success(self, template_dir, empty_schema, tmp_path, null_console):
+        """Test successful template rendering to file."""
+        engine = TemplateEngine(null_console)
+        engine.setup_environment([template_dir])
         
-        # Test invalid value
-        is_valid, error = rule.validate("Test123")
-        assert not is_valid
-        assert error == "Only lowercase letters"
+        # Render into a directory that doesn't exist yet, outside the shared
+        # template directory
+        output_path = tmp_path / "output" / "output.txt"
+        context = {"content": "test content"}
         
-        # Test valid value
-        is_valid, error = rule.validate("test")
-        assert is_valid
-        assert error is None
+        engine.render_to_file("content.j2", output_path, context, empty_schema, Path("/test"))
+        
+        assert output_path.exists()
+        assert "Content: test content" in output_path.read_text()
     
-    def test_validation_rule_length_constraints(self):
-        """Test validation rule with length constraints."""
-        rule = ValidationRule(min_length=3, max_length=10)
+    def test_render_to_stream_success(self, template_dir, empty_schema, null_console):
+        """Test successful template rendering to an open stream."""
+        engine = TemplateEngine(null_console)
+        engine.setup_environment([template_dir])
         
-        # Test too short
-        is_valid, error = rule.validate("ab")
-        assert not is_valid
-        assert "Minimum length" in error
+        output = io.StringIO()
+        context = {"content": "test content"}
         
-        # Test too long
-        is_valid, error = rule.validate("abcdefghijk")
-        assert not is_valid
-        assert "Maximum length" in error
+        engine.render_to_file("content.j2", output, context, empty_schema, Path("/test"))
         
-        # Test valid length
-        is_valid, error = rule.validate("abcde")
-        assert is_valid
-        assert error is None
+        assert "Content: test content" in output.getvalue()
+    
+    def test_list_available_templates(self, template_dir, null_console):
+        """Test listing available templates."""
+        engine = TemplateEngine(null_console)
+        
+        templates = engine.list_available_templates([template_dir])
+        
+        assert "template1.j2" in templates
+        assert "template2.j2" in templates
+        assert "not_template.txt" not in templates
+
+
+# Rules shared by the parametrized ValidationRule cases
+_REQUIRED_RULE = ValidationRule(required=True)
+_LOWERCASE_RULE = ValidationRule(regex=r"^[a-z]+$", error_message="Only lowercase letters")
+_LENGTH_RULE = ValidationRule(min_length=3, max_length=10)
+
+
+class TestQuestionnaireSchemaValidation:
+    """Test questionnaire schema validation logic."""
     
-    def test_question_condition_evaluation(self):
+    @pytest.mark.parametrize(
+        "rule,value,expect_valid,error_substring",
+        [
+            # Required fields
+            (_REQUIRED_RULE, "", False, "required"),
+            (_REQUIRED_RULE, "test", True, None),
+            # Regex with custom error message
+            (_LOWERCASE_RULE, "Test123", False, "Only lowercase letters"),
+            (_LOWERCASE_RULE, "test", True, None),
+            # Length constraints
+            (_LENGTH_RULE, "ab", False, "Minimum length"),
+            (_LENGTH_RULE, "abcdefghijk", False, "Maximum length"),
+            (_LENGTH_RULE, "abcde", True, None),
+        ],
+    )
+    def test_validation_rule(self, rule, value, expect_valid, error_substring):
+        """Test ValidationRule required, regex and length checks."""
+        is_valid, error = rule.validate(value)
+        
+        assert is_valid is expect_valid
+        if error_substring is None:
+            assert error is None
+        else:
+            assert error_substring.lower() in error.lower()
+    
+    def test_question_condition_evaluation(self, conditional_question):
         """Test question condition evaluation."""
-        question = Question(
-            id="conditional_q",
-            type=QuestionType.TEXT,
-            prompt="Conditional question?",
-            condition="use_feature == true"
-        )
+        question = conditional_question
         
         # Test condition met
         answers = {"use_feature": True}
@@ -492,6 +576,38 @@ class TestQuestionnaireSchemaValidation:
         answers = {}
         assert question.evaluate_condition(answers) is False
     
+    def test_question_condition_string_and_invalid_formats(self):
+        """Test string-valued and malformed question conditions."""
+        question = Question(
+            id="docker_q",
+            type=QuestionType.TEXT,
+            prompt="Docker question?",
+            condition="local_testing == 'docker'"
+        )
+        assert question.evaluate_condition({"local_testing": "docker"}) is True
+        assert question.evaluate_condition({"local_testing": "pytest"}) is False
+        
+        # Malformed conditions never hide the question
+        malformed = Question(
+            id="malformed_q",
+            type=QuestionType.TEXT,
+            prompt="Malformed question?",
+            condition="local_testing is docker"
+        )
+        assert malformed.evaluate_condition({}) is True
+    
+    def test_schema_models_are_immutable(self, conditional_question):
+        """Test that schema models are frozen and slotted."""
+        rule = ValidationRule(regex=r"^[a-z]+$")
+        
+        with pytest.raises(AttributeError):
+            rule.regex = r"^[0-9]+$"
+        with pytest.raises(AttributeError):
+            conditional_question.condition = None
+        assert not hasattr(rule, "__dict__")
+        assert not hasattr(conditional_question, "__dict__")
+        assert rule == ValidationRule(regex=r"^[a-z]+$")
+    
     def test_questionnaire_schema_validation(self):
         """Test questionnaire schema validation."""
         # Create schema with duplicate question IDs
@@ -512,9 +628,8 @@ class TestQuestionnaireSchemaValidation:
 class TestYamlQuestionnaireIntegration:
     """Integration tests for the complete YAML questionnaire system."""
     
-    def test_end_to_end_yaml_processing(self):
+    def test_end_to_end_yaml_processing(self, template_dir, tmp_path, null_console):
         """Test complete YAML questionnaire processing workflow."""
-        console = Mock()
         
         # Create a complete questionnaire YAML
         yaml_content = """
@@ -554,45 +669,52 @@ templates:
   llm_guidance: "llm-guidance.j2"
 """
         
-        with tempfile.TemporaryDirectory() as temp_dir:
-            # Create questionnaire file
-            questionnaire_path = Path(temp_dir) / "test-questionnaire.yaml"
-            questionnaire_path.write_text(yaml_content)
-            
-            # Create template files
-            dev_template = Path(temp_dir) / "dev-guidelines.j2"
-            dev_template.write_text("Project: {{ answers.project_name }}\nTesting: {{ answers.use_testing }}")
-            
-            llm_template = Path(temp_dir) / "llm-guidance.j2"
-            llm_template.write_text("Framework: {{ answers.testing_framework if answers.use_testing else 'None' }}")
-            
-            # Test the complete workflow
-            loader = YamlQuestionnaireLoader(console)
-            engine = DynamicQuestionnaireEngine(console)
-            template_engine = TemplateEngine(console)
-            
-            # Load questionnaire
-            schema = loader.load_from_file(questionnaire_path)
-            assert schema.metadata.name == "Integration Test Questionnaire"
-            
-            # Setup template engine
-            template_engine.setup_environment([Path(temp_dir)])
-            
-            # Simulate answers
-            answers = {
-                "project_name": "TestProject",
-                "use_testing": True,
-                "testing_framework": "pytest"
-            }
-            
-            # Validate answers
-            is_valid = engine.validate_answers(answers, schema)
-            assert is_valid
-            
-            # Render templates
-            dev_output = template_engine.render_template("dev-guidelines.j2", answers, schema, Path("/test"))
-            assert "Project: TestProject" in dev_output
-            assert "Testing: True" in dev_output
-            
-            llm_output = template_engine.render_template("llm-guidance.j2", answers, schema, Path("/test"))
-            assert "Framework: pytest" in llm_output
\ No newline at end of file
+        # Create questionnaire file; templates come from the shared set
+        questionnaire_path = tmp_path / "test-questionnaire.yaml"
+        questionnaire_path.write_text(yaml_content)
+        
+        # Test the complete workflow
+        loader = YamlQuestionnaireLoader(null_console)
+        engine = DynamicQuestionnaireEngine(null_console)
+        template_engine = TemplateEngine(null_console)
+        
+        # Load questionnaire
+        schema = loader.load_from_file(questionnaire_path)
+        assert schema.metadata.name == "Integration Test Questionnaire"
+        
+        # Setup template engine and compile the schema's templates
+        template_engine.setup_environment([template_dir])
+        template_engine.preload(schema)
+        
+        # Simulate answers
+        answers = {
+            "project_name": "TestProject",
+            "use_testing": True,
+            "testing_framework": "pytest"
+        }
+        
+        # Validate answers
+        is_valid = engine.validate_answers(answers, schema)
+        assert is_valid
+        
+        # Render templates
+        dev_output = template_engine.render_template("dev-guidelines.j2", answers, schema, Path("/test"))
+        assert "Project: TestProject" in dev_output
+        assert "Testing: True" in dev_output
+        
+        llm_output = template_engine.render_template("llm-guidance.j2", answers, schema, Path("/test"))
+        assert "Framework: pytest" in llm_output
+        
+        # Render both documents to disk in one pass
+        steering_dir = tmp_path / "steering"
+        template_engine.render_many(
+            [
+                ("dev-guidelines.j2", steering_dir / "development-guidelines.md"),
+                ("llm-guidance.j2", steering_dir / "llm-guidance.md"),
+            ],
+            answers,
+            schema,
+            Path("/test")
+        )
+        assert (steering_dir / "development-guidelines.md").read_text() == dev_output
+        assert (steering_dir / "llm-guidance.md").read_text() == llm_output